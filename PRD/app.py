@@ -1,11 +1,15 @@
+from functools import partial
+
+import orjson
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 # Your actual modules
 from sizing.prd import size_psv_for_fire
 from geometry.vessel import wetted_area_firecase, wetted_area_from_fill_volume, _build_head
+from utils.units import psig_to_barg
 from utils.validation import (
     ValidationError,
     safe_float,
@@ -21,7 +25,7 @@ from utils.validation import (
     validate_percentage,
 )
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Static + templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -39,9 +43,72 @@ VALID_ORIENTATIONS = ["Vertical"]
 VALID_HEAD_TYPES = ["ASME_FD", "Ellipsoidal", "Hemispherical"]
 
 
+# Request schema: (field, label, parser, checks, default).
+# Parsers convert the raw value and checks run domain validation on the
+# converted value; fields without a default are required.
+REQUEST_SCHEMA = (
+    ("fire_standard", "Fire Standard", partial(validate_choice, valid_choices=VALID_FIRE_STANDARDS), (), None),
+    ("orientation", "Vessel Orientation", partial(validate_choice, valid_choices=VALID_ORIENTATIONS), (), None),
+    ("head_type", "Head Type", partial(validate_choice, valid_choices=VALID_HEAD_TYPES), (), None),
+
+    # Geometry
+    ("tangent_length_m", "Tangent Length", safe_non_negative_float, (), None),
+    ("outer_diameter_m", "Outer Diameter", safe_positive_float, (), None),
+    ("shell_thickness_mm", "Shell Thickness", safe_non_negative_float, (), None),
+    ("bottom_height_m", "Bottom Height", safe_non_negative_float, (), None),
+    ("normal_fill_volume_m3", "Normal Fill Volume", safe_non_negative_float, (), None),
+
+    # Thermodynamic properties
+    ("h_fg_kJ_per_kg", "Enthalpy of Vaporization", safe_positive_float, (), None),
+    ("M_g_per_mol", "Molecular Weight", safe_positive_float, (validate_molecular_weight,), None),
+    ("k", "Specific Heat Ratio (k)", safe_positive_float, (validate_k_ratio,), None),
+    ("Z", "Compressibility Factor (Z)", safe_positive_float, (validate_compressibility,), None),
+    ("T_C", "Temperature", safe_float, (validate_temperature_celsius,), None),
+
+    # Pressures
+    ("P_operating_psig", "Operating Pressure", safe_float, (), None),
+    ("MAWP_psig", "MAWP", safe_positive_float, (), None),
+    ("atm_psia", "Atmospheric Pressure", safe_positive_float, (), 14.7),
+    ("backpressure_psig", "Backpressure", safe_non_negative_float, (), 0.0),
+    ("accum_percent", "Accumulation Percent", safe_positive_float,
+     (partial(validate_percentage, name="Accumulation Percent"),), None),
+
+    ("firefighting", "Firefighting", validate_boolean, (), None),
+
+    # Correction factors (typically 0-1, but Ke can exceed 1)
+    ("Kd", "Discharge Coefficient (Kd)", safe_positive_float,
+     (partial(validate_correction_factor, name="Kd", min_val=0.0, max_val=1.0),), None),
+    ("Kb", "Backpressure Factor (Kb)", safe_positive_float,
+     (partial(validate_correction_factor, name="Kb", min_val=0.0, max_val=1.0),), None),
+    ("Kc", "Combination Factor (Kc)", safe_positive_float,
+     (partial(validate_correction_factor, name="Kc", min_val=0.0, max_val=1.0),), None),
+    ("Ke", "Environmental Factor (Ke)", safe_positive_float,
+     (partial(validate_correction_factor, name="Ke", min_val=0.0, max_val=2.0),), 1.0),
+)
+
+
+def check_thickness_vs_radius(fields: dict) -> None:
+    """Shell thickness must be less than the vessel radius."""
+    outer_diameter_m = fields["outer_diameter_m"]
+    shell_thickness_mm = fields["shell_thickness_mm"]
+    if shell_thickness_mm / 1000.0 >= outer_diameter_m / 2:
+        raise ValidationError(
+            f"Error with Shell Thickness input: {shell_thickness_mm} mm must be less than vessel radius of {outer_diameter_m/2*1000:.1f} mm."
+        )
+
+
+# Checks spanning several fields, run on the parsed fields right after the
+# named field, so errors are reported in the same order as field checks
+CROSS_FIELD_CHECKS = {
+    "bottom_height_m": (check_thickness_vs_radius,),
+}
+
+
 def get_field(data: dict, field: str, default=None):
     """Safely get a field from the request data."""
     value = data.get(field, default)
+    if type(value) is float:
+        return value
     if value is None or (isinstance(value, str) and value.strip() == ""):
         if default is not None:
             return default
@@ -49,6 +116,89 @@ def get_field(data: dict, field: str, default=None):
     return value
 
 
+def parse_request(data: dict) -> dict:
+    """Validate the request data against REQUEST_SCHEMA in a single pass."""
+    fields = {}
+    for field, label, parser, checks, default in REQUEST_SCHEMA:
+        value = parser(get_field(data, field, default), label)
+        for check in checks:
+            check(value)
+        fields[field] = value
+        for check in CROSS_FIELD_CHECKS.get(field, ()):
+            check(fields)
+    return fields
+
+
+def run_calculation(data: dict) -> dict:
+    """
+    Run the /calculate pipeline (validation, geometry, PRD sizing) on a decoded body.
+    Pure CPU work with no framework objects; raises ValidationError / ValueError.
+    """
+    # Validate every field in one pass over the request schema
+    fields = parse_request(data)
+
+    fire_standard = fields["fire_standard"]
+    fire_height_m = FIRE_HEIGHT_LIMITS.get(fire_standard, 9.14)
+
+    h_fg_J_per_kg = fields["h_fg_kJ_per_kg"] * 1000.0
+
+    # Molecular weight: g/mol is numerically equal to lb/lbmol
+    M_lb_per_lbmol = fields["M_g_per_mol"]
+
+    # Convert operating pressure from psig to barg for API2000 calculations
+    P_design_barg = psig_to_barg(fields["P_operating_psig"], _checked=True)
+
+    MAWP_psig = fields["MAWP_psig"]
+
+    # Auto-switch to API520 if MAWP > 15 psig (API2000 not applicable)
+    if MAWP_psig > 15 and fire_standard == "API2000":
+        fire_standard = "API520"
+        fire_height_m = FIRE_HEIGHT_LIMITS.get(fire_standard, 7.62)
+
+    # Geometry calculation based on normal fill volume
+    A_wetted_m2, liquid_height_m, liquid_height_exposed_m = wetted_area_from_fill_volume(
+        orientation=fields["orientation"],
+        head_type=fields["head_type"],
+        L_tangent_m=fields["tangent_length_m"],
+        OD_m=fields["outer_diameter_m"],
+        thickness_mm=fields["shell_thickness_mm"],
+        bottom_height_m=fields["bottom_height_m"],
+        fire_height_m=fire_height_m,
+        fill_volume_m3=fields["normal_fill_volume_m3"],
+    )
+
+    # PRD sizing
+    result = size_psv_for_fire(
+        A_wetted_m2=A_wetted_m2,
+        fire_standard=fire_standard,
+        P_design_barg=P_design_barg,
+        firefighting=fields["firefighting"],
+        h_fg_J_per_kg=h_fg_J_per_kg,
+        k=fields["k"],
+        Z=fields["Z"],
+        M_lb_per_lbmol=M_lb_per_lbmol,
+        T_C=fields["T_C"],
+        MAWP_psig=MAWP_psig,
+        atm_psia=fields["atm_psia"],
+        accum_percent=fields["accum_percent"],
+        backpressure_psig=fields["backpressure_psig"],
+        Kd=fields["Kd"],
+        Kb=fields["Kb"],
+        Kc=fields["Kc"],
+        Ke=fields["Ke"],
+    )
+
+    # Sizing results plus geometry info, rounded to display precision
+    return {
+        **result._asdict(),
+        "A_wetted_m2": round(A_wetted_m2, 4),
+        "fire_height_m": fire_height_m,
+        "liquid_height_m": round(liquid_height_m, 4),
+        "liquid_height_exposed_m": round(liquid_height_exposed_m, 4),
+        "fire_standard_used": fire_standard,
+    }
+
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
@@ -59,202 +209,31 @@ async def calculate(request: Request):
     try:
         # Parse JSON body
         try:
-            data = await request.json()
-        except Exception:
-            return JSONResponse(
+            raw = await request.body()
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            return ORJSONResponse(
                 {"error": "Invalid JSON in request body."},
                 status_code=400
             )
 
         if not isinstance(data, dict):
-            return JSONResponse(
+            return ORJSONResponse(
                 {"error": "Request body must be a JSON object."},
                 status_code=400
             )
 
-        # Validate fire standard
-        fire_standard = validate_choice(
-            get_field(data, "fire_standard"),
-            "Fire Standard",
-            VALID_FIRE_STANDARDS
-        )
-        fire_height_m = FIRE_HEIGHT_LIMITS.get(fire_standard, 9.14)
-
-        # Validate orientation and head type
-        orientation = validate_choice(
-            get_field(data, "orientation"),
-            "Vessel Orientation",
-            VALID_ORIENTATIONS
-        )
-        head_type = validate_choice(
-            get_field(data, "head_type"),
-            "Head Type",
-            VALID_HEAD_TYPES
-        )
-
-        # Validate geometry inputs
-        tangent_length_m = safe_non_negative_float(
-            get_field(data, "tangent_length_m"),
-            "Tangent Length"
-        )
-        outer_diameter_m = safe_positive_float(
-            get_field(data, "outer_diameter_m"),
-            "Outer Diameter"
-        )
-        shell_thickness_mm = safe_non_negative_float(
-            get_field(data, "shell_thickness_mm"),
-            "Shell Thickness"
-        )
-        bottom_height_m = safe_non_negative_float(
-            get_field(data, "bottom_height_m"),
-            "Bottom Height"
-        )
-
-        # Validate thickness vs radius
-        if shell_thickness_mm / 1000.0 >= outer_diameter_m / 2:
-            return JSONResponse(
-                {"error": f"Error with Shell Thickness input: {shell_thickness_mm} mm must be less than vessel radius of {outer_diameter_m/2*1000:.1f} mm."},
-                status_code=400
-            )
-
-        # Validate normal fill volume
-        normal_fill_volume_m3 = safe_non_negative_float(
-            get_field(data, "normal_fill_volume_m3"),
-            "Normal Fill Volume"
-        )
-
-        # Validate thermodynamic properties
-        h_fg_kJ_per_kg = safe_positive_float(
-            get_field(data, "h_fg_kJ_per_kg"),
-            "Enthalpy of Vaporization"
-        )
-        h_fg_J_per_kg = h_fg_kJ_per_kg * 1000.0
-
-        M_g_per_mol = safe_positive_float(
-            get_field(data, "M_g_per_mol"),
-            "Molecular Weight"
-        )
-        validate_molecular_weight(M_g_per_mol)
-        # Molecular weight: g/mol is numerically equal to lb/lbmol
-        M_lb_per_lbmol = M_g_per_mol
-
-        k = safe_positive_float(get_field(data, "k"), "Specific Heat Ratio (k)")
-        validate_k_ratio(k)
-
-        Z = safe_positive_float(get_field(data, "Z"), "Compressibility Factor (Z)")
-        validate_compressibility(Z)
-
-        T_C = safe_float(get_field(data, "T_C"), "Temperature")
-        validate_temperature_celsius(T_C)
-
-        # Validate pressure inputs
-        P_operating_psig = safe_float(
-            get_field(data, "P_operating_psig"),
-            "Operating Pressure"
-        )
-        # Convert operating pressure from psig to barg for API2000 calculations
-        # 1 psi = 0.0689476 bar
-        P_design_barg = P_operating_psig * 0.0689476
-        
-        MAWP_psig = safe_positive_float(
-            get_field(data, "MAWP_psig"),
-            "MAWP"
-        )
-        atm_psia = safe_positive_float(
-            get_field(data, "atm_psia", 14.7),
-            "Atmospheric Pressure"
-        )
-        backpressure_psig = safe_non_negative_float(
-            get_field(data, "backpressure_psig", 0.0),
-            "Backpressure"
-        )
-        accum_percent = safe_positive_float(
-            get_field(data, "accum_percent"),
-            "Accumulation Percent"
-        )
-        validate_percentage(accum_percent, "Accumulation Percent")
-
-        # Validate firefighting flag
-        firefighting = validate_boolean(
-            get_field(data, "firefighting"),
-            "Firefighting"
-        )
-
-        # Validate correction factors (typically 0-1, but some can exceed 1)
-        Kd = safe_positive_float(get_field(data, "Kd"), "Discharge Coefficient (Kd)")
-        validate_correction_factor(Kd, "Kd", 0.0, 1.0)
-
-        Kb = safe_positive_float(get_field(data, "Kb"), "Backpressure Factor (Kb)")
-        validate_correction_factor(Kb, "Kb", 0.0, 1.0)
-
-        Kc = safe_positive_float(get_field(data, "Kc"), "Combination Factor (Kc)")
-        validate_correction_factor(Kc, "Kc", 0.0, 1.0)
-
-        Ke = safe_positive_float(get_field(data, "Ke", 1.0), "Environmental Factor (Ke)")
-        validate_correction_factor(Ke, "Ke", 0.0, 2.0)  # Ke can be > 1
-
-        # Auto-switch to API520 if MAWP > 15 psig (API2000 not applicable)
-        if MAWP_psig > 15 and fire_standard == "API2000":
-            fire_standard = "API520"
-            fire_height_m = FIRE_HEIGHT_LIMITS.get(fire_standard, 7.62)
-
-        # Geometry calculation based on normal fill volume
-        geometry_result = wetted_area_from_fill_volume(
-            orientation=orientation,
-            head_type=head_type,
-            L_tangent_m=tangent_length_m,
-            OD_m=outer_diameter_m,
-            thickness_mm=shell_thickness_mm,
-            bottom_height_m=bottom_height_m,
-            fire_height_m=fire_height_m,
-            fill_volume_m3=normal_fill_volume_m3,
-        )
-        A_wetted_m2 = geometry_result["wetted_area_m2"]
-        liquid_height_m = geometry_result["liquid_height_m"]
-        liquid_height_exposed_m = geometry_result["liquid_height_exposed_m"]
-
-        # PRD sizing
-        result = size_psv_for_fire(
-            A_wetted_m2=A_wetted_m2,
-            fire_standard=fire_standard,
-            P_design_barg=P_design_barg,
-            firefighting=firefighting,
-            h_fg_J_per_kg=h_fg_J_per_kg,
-            k=k,
-            Z=Z,
-            M_lb_per_lbmol=M_lb_per_lbmol,
-            T_C=T_C,
-            MAWP_psig=MAWP_psig,
-            atm_psia=atm_psia,
-            accum_percent=accum_percent,
-            backpressure_psig=backpressure_psig,
-            Kd=Kd,
-            Kb=Kb,
-            Kc=Kc,
-            Ke=Ke,
-        )
-
-        # Add geometry info
-        result["A_wetted_m2"] = A_wetted_m2
-        result["fire_height_m"] = fire_height_m
-        result["liquid_height_m"] = liquid_height_m
-        result["liquid_height_exposed_m"] = liquid_height_exposed_m
-        result["fire_standard_used"] = fire_standard
-
-        return JSONResponse(result)
-
-    except ValidationError as e:
-        # User-friendly validation errors
-        return JSONResponse({"error": str(e)}, status_code=400)
+        return ORJSONResponse(run_calculation(data))
 
-    except ValueError as e:
-        # Catch domain-specific errors from downstream modules
-        return JSONResponse({"error": str(e)}, status_code=400)
+    except (ValidationError, ValueError) as e:
+        # User-friendly validation errors and domain-specific errors
+        # from downstream modules
+        return ORJSONResponse({"error": str(e)}, status_code=400)
 
     except Exception as e:
         # Log unexpected errors but return a generic message
         print("🔥 Unexpected error in /calculate:", e)
-        return JSONResponse(
+        return ORJSONResponse(
             {"error": "An unexpected error occurred. Please check your inputs and try again."},
             status_code=500
         )
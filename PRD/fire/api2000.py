@@ -1,3 +1,19 @@
+from bisect import bisect_right
+from functools import lru_cache
+
+import numpy as np
+
+
+# API2000 table rows 1-4 (P ≤ 1.034 barg): Q = coef × A^exp (Watts)
+#   Row 1: A < 18.6 m²
+#   Row 2: 18.6 ≤ A < 93 m²
+#   Row 3: 93 ≤ A < 260 m²
+#   Row 4: A ≥ 260 m², 0.07 ≤ P ≤ 1.034 barg
+_API2000_AREA_BREAKS = (18.6, 93.0, 260.0)
+_API2000_COEFS = (63150.0, 224200.0, 630400.0, 43200.0)
+_API2000_EXPS = (1.0, 0.566, 0.338, 0.82)
+
+
 def heat_load_api2000(A_wetted_m2: float, P_design_barg: float) -> float:
     """
     API2000 fire heat load (Watts) from wetted area (m²) and design pressure (barg).
@@ -23,6 +39,15 @@ def heat_load_api2000(A_wetted_m2: float, P_design_barg: float) -> float:
     except (TypeError, ValueError):
         raise ValueError(f"Design pressure must be a valid number, got: {P_design_barg}")
 
+    return _heat_load_api2000_cached(A_wetted_m2, P_design_barg)
+
+
+@lru_cache(maxsize=4096)
+def _heat_load_api2000_cached(A_wetted_m2: float, P_design_barg: float) -> float:
+    """
+    API2000 table lookup on already-validated floats.
+    Memoized so repeated sizing runs on the same geometry skip the power laws.
+    """
     # -----------------------------------------
     # HIGH-PRESSURE CASE → NOT COVERED BY API2000
     # -----------------------------------------
@@ -35,27 +60,30 @@ def heat_load_api2000(A_wetted_m2: float, P_design_barg: float) -> float:
     # LOW-PRESSURE CASES (API2000 TABLE)
     # -----------------------------------------
 
-    # Row 1: A < 18.6 m², P ≤ 1.034 barg
-    if A_wetted_m2 < 18.6:
-        return 63150 * A_wetted_m2
-
-    # Row 2: 18.6 ≤ A < 93 m², P ≤ 1.034 barg
-    if 18.6 <= A_wetted_m2 < 93:
-        return 224200 * (A_wetted_m2 ** 0.566)
-
-    # Row 3: 93 ≤ A < 260 m², P ≤ 1.034 barg
-    if 93 <= A_wetted_m2 < 260:
-        return 630400 * (A_wetted_m2 ** 0.338)
-
-    # Row 4: A ≥ 260 m², 0.07 ≤ P ≤ 1.034 barg
-    if A_wetted_m2 >= 260 and P_design_barg >= 0.07:
-        return 43200 * (A_wetted_m2 ** 0.82)
-
-    # Row 5: A ≥ 260 m², P ≤ 0.07 barg
+    # Row 5: A ≥ 260 m², P < 0.07 barg
     if A_wetted_m2 >= 260 and P_design_barg < 0.07:
         return 4129700.0
 
-    # Should never reach here
-    raise ValueError(
-        f"Unexpected API2000 input combination: A={A_wetted_m2}, P={P_design_barg}"
+    # Rows 1-4: Q = coef × A^exp, row picked by the wetted-area breakpoints
+    row = bisect_right(_API2000_AREA_BREAKS, A_wetted_m2)
+    return _API2000_COEFS[row] * A_wetted_m2 ** _API2000_EXPS[row]
+
+
+def heat_load_api2000_batch(A_wetted_m2, P_design_barg) -> np.ndarray:
+    """
+    Vectorized heat_load_api2000 for parametric sweeps.
+    A_wetted_m2 (m²) and P_design_barg (barg) are array-likes that broadcast
+    against each other; returns the heat loads (Watts) as a float64 array.
+    """
+    A, P = np.broadcast_arrays(
+        np.asarray(A_wetted_m2, dtype=np.float64),
+        np.asarray(P_design_barg, dtype=np.float64),
     )
+    if np.any(A < 0):
+        raise ValueError(f"Wetted area cannot be negative, got: {A.min()} m²")
+
+    # Rows 1-4 by wetted-area breakpoint, then the pressure overrides
+    row = np.searchsorted(_API2000_AREA_BREAKS, A, side="right")
+    Q = np.asarray(_API2000_COEFS)[row] * A ** np.asarray(_API2000_EXPS)[row]
+    Q = np.where((A >= 260) & (P < 0.07), 4129700.0, Q)
+    return np.where(P > 1.034, 10800.0 * A, Q)
@@ -1,3 +1,34 @@
+from functools import lru_cache
+
+import numpy as np
+
+
+def _parse_firefighting(firefighting) -> bool:
+    """Normalize the firefighting flag, accepting common true/false strings."""
+    if firefighting is None:
+        raise ValueError("Firefighting parameter is required.")
+    if isinstance(firefighting, bool):
+        return firefighting
+    if isinstance(firefighting, str):
+        lower = firefighting.lower().strip()
+        if lower in ("true", "1", "yes"):
+            return True
+        if lower in ("false", "0", "no"):
+            return False
+        raise ValueError(
+            f"Firefighting must be true/false, got: '{firefighting}'"
+        )
+    return bool(firefighting)
+
+
+def _parse_firefighting_batch(firefighting) -> np.ndarray:
+    """Element-wise _parse_firefighting; bool arrays pass through unchanged."""
+    flags = np.asarray(firefighting)
+    if flags.dtype == bool:
+        return flags
+    return np.vectorize(_parse_firefighting, otypes=[bool])(flags.astype(object))
+
+
 def heat_load_api520(A_wetted: float, firefighting: bool) -> float:
     """
     API520 fire heat input (Watts) based on wetted surface area and firefighting/drainage status.
@@ -18,22 +49,31 @@ def heat_load_api520(A_wetted: float, firefighting: bool) -> float:
         return 0.0  # No wetted area means no heat load
 
     # Validate firefighting flag
-    if firefighting is None:
-        raise ValueError("Firefighting parameter is required.")
-    if not isinstance(firefighting, bool):
-        # Try to convert common string values
-        if isinstance(firefighting, str):
-            lower = firefighting.lower().strip()
-            if lower in ("true", "1", "yes"):
-                firefighting = True
-            elif lower in ("false", "0", "no"):
-                firefighting = False
-            else:
-                raise ValueError(
-                    f"Firefighting must be true/false, got: '{firefighting}'"
-                )
-        else:
-            firefighting = bool(firefighting)
+    firefighting = _parse_firefighting(firefighting)
+
+    return _heat_load_api520_cached(A_wetted, firefighting)
+
 
+@lru_cache(maxsize=4096)
+def _heat_load_api520_cached(A_wetted: float, firefighting: bool) -> float:
+    """
+    API520 heat input on already-validated inputs.
+    Memoized so repeated sizing runs on the same geometry skip the power law.
+    """
     C = 43200 if firefighting else 70900
     return C * A_wetted ** 0.82
+
+
+def heat_load_api520_batch(A_wetted, firefighting) -> np.ndarray:
+    """
+    Vectorized heat_load_api520 for parametric sweeps.
+    A_wetted (m²) is an array-like; firefighting is a bool or an array of
+    bools (or true/false strings, as accepted by heat_load_api520)
+    broadcasting against it. Returns heat loads (Watts) as an array.
+    """
+    A = np.asarray(A_wetted, dtype=np.float64)
+    if np.any(A < 0):
+        raise ValueError(f"Wetted area cannot be negative, got: {A.min()} m²")
+
+    C = np.where(_parse_firefighting_batch(firefighting), 43200.0, 70900.0)
+    return C * A ** 0.82
@@ -1,4 +1,10 @@
 import math
+from functools import lru_cache
+
+import numpy as np
+
+from utils._floats import _safe_float, _validate_positive, _validate_non_negative, _validate_factor
+from utils.units import KG_TO_LB
 
 
 # ============================================================
@@ -7,12 +13,11 @@ import math
 
 def _validate_k(k: float) -> float:
     """Validate specific heat ratio."""
-    if k is None:
-        raise ValueError("Specific heat ratio (k) is required.")
-    try:
-        k = float(k)
-    except (TypeError, ValueError):
-        raise ValueError(f"Specific heat ratio must be a valid number, got: {k}")
+    if type(k) is not float:
+        k = _safe_float(
+            k, "Specific heat ratio (k)",
+            invalid="Specific heat ratio must be a valid number, got: {value}",
+        )
     if k <= 1.0:
         raise ValueError(
             f"Specific heat ratio (k) must be > 1.0 for real gases, got: {k}. "
@@ -26,38 +31,15 @@ def _validate_k(k: float) -> float:
     return k
 
 
-def _validate_positive(value: float, name: str) -> float:
-    """Validate that a value is positive."""
-    if value is None:
-        raise ValueError(f"{name} is required.")
-    try:
-        value = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
-    if value <= 0:
-        raise ValueError(f"{name} must be positive, got: {value}")
-    return value
-
-
-def _validate_non_negative(value: float, name: str) -> float:
-    """Validate that a value is non-negative."""
-    if value is None:
-        raise ValueError(f"{name} is required.")
-    try:
-        value = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
-    if value < 0:
-        raise ValueError(f"{name} cannot be negative, got: {value}")
-    return value
-
-
-def _validate_factor(value: float, name: str, min_val: float = 0.0, max_val: float = 1.0) -> float:
-    """Validate a correction factor."""
-    value = _validate_positive(value, name)
-    if value > max_val:
-        raise ValueError(f"{name} should not exceed {max_val}, got: {value}")
-    return value
+def _validate_compressibility(Z: float) -> float:
+    """Validate compressibility factor."""
+    Z = _validate_positive(Z, "Compressibility factor (Z)")
+    if Z > 2.0:
+        raise ValueError(
+            f"Compressibility factor Z = {Z} is unusually high. "
+            f"Typical range is 0.2 to 1.2."
+        )
+    return Z
 
 
 # ============================================================
@@ -70,9 +52,14 @@ def C_gas(k: float) -> float:
     k = ratio of specific heats.
     """
     k = _validate_k(k)
-    return 520.0 * math.sqrt(
-        k * (2.0 / (k + 1.0)) ** ((k + 1.0) / (k - 1.0))
-    )
+    return _C_gas(k)
+
+
+@lru_cache(maxsize=256)
+def _C_gas(k: float) -> float:
+    """C_gas on an already-validated k (memoized; k takes few distinct values)."""
+    kp1 = k + 1.0
+    return 520.0 * math.sqrt(k * (2.0 / kp1) ** (kp1 / (k - 1.0)))
 
 
 def F2_subcritical(k: float, r: float) -> float:
@@ -94,12 +81,36 @@ def F2_subcritical(k: float, r: float) -> float:
             f"Pressure ratio (r = P2/P1) must be between 0 and 1 for subcritical flow, got: {r}"
         )
     
-    num = (k / (k - 1.0)) * (r ** k) * (
-        (1.0 - r ** ((k - 1.0) / k)) / (1.0 - r)
-    )
+    return _F2_subcritical(k, r)
+
+
+@lru_cache(maxsize=256)
+def _F2_subcritical(k: float, r: float) -> float:
+    """F2_subcritical on an already-validated k and 0 < r < 1 (memoized)."""
+    # r^k and r^((k-1)/k) share a single log(r)
+    km1 = k - 1.0
+    log_r = math.log(r)
+    r_k = math.exp(k * log_r)
+    r_km1_k = math.exp((km1 / k) * log_r)
+    num = (k / km1) * r_k * ((1.0 - r_km1_k) / (1.0 - r))
     return math.sqrt(num)
 
 
+def _C_gas_batch(k) -> np.ndarray:
+    """Vectorized _C_gas over an array of already-validated k."""
+    kp1 = k + 1.0
+    return 520.0 * np.sqrt(k * (2.0 / kp1) ** (kp1 / (k - 1.0)))
+
+
+def _F2_subcritical_batch(k, r) -> np.ndarray:
+    """Vectorized _F2_subcritical over arrays of already-validated k and r."""
+    km1 = k - 1.0
+    log_r = np.log(r)
+    r_k = np.exp(k * log_r)
+    r_km1_k = np.exp((km1 / k) * log_r)
+    return np.sqrt((k / km1) * r_k * ((1.0 - r_km1_k) / (1.0 - r)))
+
+
 # ============================================================
 #  REQUIRED AREA — CRITICAL FLOW
 # ============================================================
@@ -134,12 +145,7 @@ def required_area_critical_gas(
     k = _validate_k(k)
     T_R = _validate_positive(T_R, "Temperature (°R)")
     
-    Z = _validate_positive(Z, "Compressibility factor (Z)")
-    if Z > 2.0:
-        raise ValueError(
-            f"Compressibility factor Z = {Z} is unusually high. "
-            f"Typical range is 0.2 to 1.2."
-        )
+    Z = _validate_compressibility(Z)
     
     M_lb_per_lbmol = _validate_positive(M_lb_per_lbmol, "Molecular weight (M)")
     P1_psia = _validate_positive(P1_psia, "Relieving pressure (P1_psia)")
@@ -148,7 +154,24 @@ def required_area_critical_gas(
     Kb = _validate_factor(Kb, "Backpressure factor (Kb)", 0.0, 1.0)
     Kc = _validate_factor(Kc, "Combination factor (Kc)", 0.0, 1.0)
     
-    C = C_gas(k)
+    return _required_area_critical_gas(
+        W_lb_per_hr, k, T_R, Z, M_lb_per_lbmol, P1_psia, Kd, Kb, Kc
+    )
+
+
+def _required_area_critical_gas(
+    W_lb_per_hr: float,
+    k: float,
+    T_R: float,
+    Z: float,
+    M_lb_per_lbmol: float,
+    P1_psia: float,
+    Kd: float,
+    Kb: float,
+    Kc: float,
+) -> float:
+    """Critical-flow area math on already-validated inputs."""
+    C = _C_gas(k)
 
     num = W_lb_per_hr * math.sqrt(T_R * Z / M_lb_per_lbmol)
     den = C * Kd * P1_psia * Kb * Kc
@@ -196,12 +219,7 @@ def required_area_subcritical_gas(
     k = _validate_k(k)
     T_R = _validate_positive(T_R, "Temperature (°R)")
     
-    Z = _validate_positive(Z, "Compressibility factor (Z)")
-    if Z > 2.0:
-        raise ValueError(
-            f"Compressibility factor Z = {Z} is unusually high. "
-            f"Typical range is 0.2 to 1.2."
-        )
+    Z = _validate_compressibility(Z)
     
     M_lb_per_lbmol = _validate_positive(M_lb_per_lbmol, "Molecular weight (M)")
     P1_psia = _validate_positive(P1_psia, "Relieving pressure (P1_psia)")
@@ -215,8 +233,25 @@ def required_area_subcritical_gas(
     Kd = _validate_factor(Kd, "Discharge coefficient (Kd)", 0.0, 1.0)
     Ke = _validate_factor(Ke, "Environmental factor (Ke)", 0.0, 2.0)  # Ke can exceed 1
     
+    return _required_area_subcritical_gas(
+        W_lb_per_hr, k, T_R, Z, M_lb_per_lbmol, P1_psia, P2_psia, Kd, Ke
+    )
+
+
+def _required_area_subcritical_gas(
+    W_lb_per_hr: float,
+    k: float,
+    T_R: float,
+    Z: float,
+    M_lb_per_lbmol: float,
+    P1_psia: float,
+    P2_psia: float,
+    Kd: float,
+    Ke: float,
+) -> float:
+    """Subcritical-flow area math on already-validated inputs (P2 < P1)."""
     r = P2_psia / P1_psia
-    F2 = F2_subcritical(k, r)
+    F2 = _F2_subcritical(k, r)
 
     pressure_diff = P1_psia - P2_psia
     if pressure_diff <= 0:
@@ -241,4 +276,4 @@ def required_area_subcritical_gas(
 
 def kg_per_hr_to_lb_per_hr(m_kg_per_hr: float) -> float:
     """Convert kg/hr → lb/hr."""
-    return m_kg_per_hr * 2.2046226218
+    return m_kg_per_hr * KG_TO_LB
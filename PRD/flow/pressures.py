@@ -1,27 +1,6 @@
-def _validate_positive(value: float, name: str) -> float:
-    """Validate that a value is positive."""
-    if value is None:
-        raise ValueError(f"{name} is required.")
-    try:
-        value = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
-    if value <= 0:
-        raise ValueError(f"{name} must be positive, got: {value}")
-    return value
+from functools import lru_cache
 
-
-def _validate_non_negative(value: float, name: str) -> float:
-    """Validate that a value is non-negative."""
-    if value is None:
-        raise ValueError(f"{name} is required.")
-    try:
-        value = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
-    if value < 0:
-        raise ValueError(f"{name} cannot be negative, got: {value}")
-    return value
+from utils._floats import _safe_float, _validate_positive, _validate_non_negative
 
 
 def max_accumulation(MAWP_psig: float, accumulation_percent: float) -> float:
@@ -58,19 +37,25 @@ def critical_downstream_pressure(P1_psia: float, k: float) -> float:
     """
     P1_psia = _validate_positive(P1_psia, "Relieving pressure (P1_psia)")
     
-    if k is None:
-        raise ValueError("Specific heat ratio (k) is required.")
-    try:
-        k = float(k)
-    except (TypeError, ValueError):
-        raise ValueError(f"Specific heat ratio must be a valid number, got: {k}")
+    k = _safe_float(
+        k, "Specific heat ratio (k)",
+        invalid="Specific heat ratio must be a valid number, got: {value}",
+    )
     if k <= 1.0:
         raise ValueError(
             f"Specific heat ratio (k) must be > 1.0 for real gases, got: {k}"
         )
     
-    ratio = (2.0 / (k + 1.0)) ** (k / (k - 1.0))
-    return ratio * P1_psia
+    return _critical_pressure_ratio(k) * P1_psia
+
+
+@lru_cache(maxsize=256)
+def _critical_pressure_ratio(k: float) -> float:
+    """
+    Critical-to-relieving pressure ratio (2 / (k + 1))^(k / (k - 1)) on an
+    already-validated k > 1 (memoized; k takes few distinct values).
+    """
+    return (2.0 / (k + 1.0)) ** (k / (k - 1.0))
 
 
 def downstream_pressure(P_back_psig: float, atm_psia: float) -> float:
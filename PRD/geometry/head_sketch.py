@@ -1,10 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
 from heads import ASMEFDHead, Elliptical2to1Head, HemisphericalHead
 
 def plot_single_head(head, label, color):
-    h_top = getattr(head, "h3", head.h2)
+    # Imported here so matplotlib never loads unless a plot is drawn
+    import matplotlib.pyplot as plt
+
+    h_top = head.h3
     hs = np.linspace(head.h1, h_top, 10000)
     rs = [head.radius_at_height(h) for h in hs]
 
@@ -20,20 +22,21 @@ def plot_single_head(head, label, color):
     ax.grid(True)
     plt.show()
 
-# ---------------------------------------------------------
-# Instantiate heads
-# ---------------------------------------------------------
-diameter = 1.0
-thickness = 0.015
-
-fd   = ASMEFDHead(diameter, thickness)
-ell  = Elliptical2to1Head(diameter, thickness)
-hemi = HemisphericalHead(diameter, thickness)
-
-# ---------------------------------------------------------
-# Plot each head separately
-# ---------------------------------------------------------
-plot_single_head(fd,   "ASME F&D",          "blue")
-plot_single_head(ell,  "ASME 2:1 Ellipsoidal", "green")
-plot_single_head(hemi, "Hemispherical",     "red")
+if __name__ == "__main__":
+    # ---------------------------------------------------------
+    # Instantiate heads
+    # ---------------------------------------------------------
+    diameter = 1.0
+    thickness = 0.015
+
+    fd   = ASMEFDHead(diameter, thickness)
+    ell  = Elliptical2to1Head(diameter, thickness)
+    hemi = HemisphericalHead(diameter, thickness)
+
+    # ---------------------------------------------------------
+    # Plot each head separately
+    # ---------------------------------------------------------
+    plot_single_head(fd,   "ASME F&D",          "blue")
+    plot_single_head(ell,  "ASME 2:1 Ellipsoidal", "green")
+    plot_single_head(hemi, "Hemispherical",     "red")
 
@@ -1,5 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import math
+import warnings
+
+import numpy as np
 
 
 # ============================================================
@@ -37,145 +41,280 @@ def _validate_head_dimensions(diameter: float, thickness: float) -> tuple:
     return diameter, thickness
 
 
-# ============================================================
-#  ASME F&D Head
-# ============================================================
+def _derived():
+    """Dataclass field computed in __post_init__ (not an init, repr or eq field)."""
+    return field(init=False, repr=False, compare=False)
 
-@dataclass
-class ASMEFDHead:
-    diameter: float      # external diameter (m)
-    thickness: float     # wall thickness (m)
 
-    def __post_init__(self):
-        # Validate dimensions
-        self.diameter, self.thickness = _validate_head_dimensions(
-            self.diameter, self.thickness
+def _warn_steps_ignored(steps, stacklevel=3):
+    """Deprecation warning for the legacy `steps` argument of the closed-form integrals."""
+    if steps is not None:
+        warnings.warn(
+            "`steps` is deprecated and ignored: head areas and volumes are "
+            "integrated in closed form or by fixed Gauss-Legendre quadrature.",
+            DeprecationWarning,
+            stacklevel=stacklevel,
         )
-        
-        # ASME F&D proportions
-        self.major = 1.00   # crown radius / D
-        self.minor = 0.06   # knuckle radius / D
 
-        # External radii
-        Rc_ext = self.major * self.diameter
-        Rk_ext = self.minor * self.diameter
-        R_ext  = self.diameter / 2
 
-        # External geometry
-        a_ext = Rc_ext - Rk_ext
-        b_ext = R_ext - Rk_ext
+def _set_fields(obj, **values):
+    """Assign fields on a frozen dataclass instance (for use in __post_init__)."""
+    for name, value in values.items():
+        object.__setattr__(obj, name, value)
 
-        rp2_ext = (self.diameter - 2 * Rk_ext) / 2
-        hp2_ext = Rc_ext - math.sqrt(a_ext**2 - b_ext**2)
 
-        # Internal radii (thin-wall approximation)
-        self.crown_radius   = Rc_ext - self.thickness
-        self.knuckle_radius = Rk_ext - self.thickness
-        self.radius         = R_ext  - self.thickness
-
-        # Internal circle centers (same as external)
-        self.c_height_offset = Rc_ext
-        self.c_radius_offset = 0.0
+# ============================================================
+#  Integration Helpers
+# ============================================================
 
-        self.k_height_offset = hp2_ext
-        self.k_radius_offset = rp2_ext
+def _circle_band_volume(R: float, h0: float, offset: float, a: float, b: float) -> float:
+    """
+    Closed-form volume (m³) of revolution between heights a and b for the
+    profile r(h) = sqrt(max(R² - (h - h0)², 0)) + offset, matching the
+    clamped circle used by radius_at_height.
+    """
+    if b <= a:
+        return 0.0
+
+    R2 = R * R
+    R_abs = abs(R)
+
+    # Part of [a, b] where the circle term is non-zero (u = h - h0)
+    u0 = max(a - h0, -R_abs)
+    u1 = min(b - h0, R_abs)
+
+    # π·∫(R² - u²)du + π·offset²·(b - a)
+    total = offset * offset * (b - a)
+    if u1 > u0:
+        total += R2 * (u1 - u0) - (u1**3 - u0**3) / 3
+
+        # 2π·offset·∫sqrt(R² - u²)du
+        if offset != 0.0:
+            def _F(u):
+                return 0.5 * (u * math.sqrt(max((R_abs - u) * (R_abs + u), 0.0)) + R2 * math.asin(u / R_abs))
+            total += 2 * offset * (_F(u1) - _F(u0))
+
+    return math.pi * total
+
+
+def _circle_profile_vec(h, R: float, h0: float, offset: float):
+    """
+    Radius and analytic dr/dh on an array of heights for the clamped circle
+    profile r(h) = sqrt(max(R² - (h - h0)², 0)) + offset. The slope is taken
+    as zero where the circle term is clamped.
+    """
+    u = h - h0
+    s = np.sqrt(np.maximum((R - u) * (R + u), 0.0))
+    dr_dh = np.divide(-u, s, out=np.zeros_like(s), where=s > 0.0)
+    return s + offset, dr_dh
+
+
+# Gauss–Legendre orders per profile piece. Knuckle arcs get the full rule,
+# which integrates them to near machine precision. Spherical zones and
+# constant-radius bands have integrands linear in t = sqrt(h - a), so a
+# 2-point rule is already exact there.
+_GL_ORDER = 20
+_GL_ORDER_ZONE = 2
+
+
+@lru_cache(maxsize=None)
+def _gauss_legendre(n: int) -> tuple:
+    """Nodes and weights of the n-point Gauss–Legendre rule on [-1, 1]."""
+    return np.polynomial.legendre.leggauss(n)
+
+
+def _piece_order(head, i: int) -> int:
+    """Quadrature order for profile piece i of a head, from its geometry."""
+    return _GL_ORDER_ZONE if head._profile_is_zone[i] else _GL_ORDER
+
+
+def gauss_integrate(f, a, b, n: int = _GL_ORDER):
+    """
+    Integrate f over [a, b] with the n-point Gauss–Legendre rule.
+    f must accept arrays; a and b may be arrays of interval bounds, in which
+    case one integral per interval is returned.
+    """
+    nodes, weights = _gauss_legendre(n)
+    a = np.asarray(a, dtype=np.float64)[..., None]
+    b = np.asarray(b, dtype=np.float64)[..., None]
+    half = 0.5 * (b - a)
+    mid = 0.5 * (a + b)
+    return np.sum(half * weights * f(mid + half * nodes), axis=-1)
+
+
+def _surface_integrand(head, a):
+    """
+    Integrand 2π·r·sqrt(1 + (dr/dh)²) of the surface-of-revolution area on a
+    piece starting at height a, in the variable t = sqrt(h - a). The slope
+    blows up like 1/sqrt(h - a) where a clamped circle term starts; the
+    substitution h = a + t² makes the integrand smooth there.
+    """
+    def f(t):
+        r, dr_dh = head._r_and_drdh_vec(a + t * t)
+        return 4 * math.pi * t * r * np.sqrt(1 + dr_dh * dr_dh)
+    return f
+
+
+def _surface_area_up_to(head, h: float) -> float:
+    """
+    Wetted surface area (m²) of a head from h1 up to height h by
+    surface-of-revolution integration, one Gauss–Legendre rule per smooth
+    piece of the profile between head._profile_breaks.
+    """
+    if h <= head.h1:
+        return 0.0
+
+    total = 0.0
+    breaks = head._profile_breaks
+    for i, (a, b) in enumerate(zip(breaks[:-1], breaks[1:])):
+        if a >= h:
+            break
+        total += gauss_integrate(
+            _surface_integrand(head, a), 0.0, math.sqrt(min(b, h) - a), _piece_order(head, i)
+        )
 
-        # Transition heights
-        self.h1 = 0.0
-        alpha_ext = math.asin(rp2_ext / (Rc_ext - Rk_ext))
-        self.h2 = Rc_ext - math.cos(alpha_ext) * Rc_ext
-        self.h3 = self.k_height_offset
+    return float(total)
 
 
-    # --------------------------------------------------------
+def _surface_area_up_to_vec(head, h) -> np.ndarray:
+    """
+    Vectorized _surface_area_up_to over a 1-D array of heights h (m). Each
+    profile piece is integrated for all heights at once, with the interval
+    clipped to [piece start, h].
+    """
+    h = np.asarray(h, dtype=np.float64)
 
-    def radius_at_height(self, h):
-        """Internal radius at height h inside the head."""
-        if h <= self.h2:
-            val = self.crown_radius**2 - (h - self.c_height_offset)**2
-            return math.sqrt(max(val, 0.0)) + self.c_radius_offset
-
-        if h <= self.h3:
-            val = self.knuckle_radius**2 - (h - self.k_height_offset)**2
-            return math.sqrt(max(val, 0.0)) + self.k_radius_offset
+    breaks = head._profile_breaks
+    total = np.zeros_like(h)
+    for i, (a, b) in enumerate(zip(breaks[:-1], breaks[1:])):
+        total += gauss_integrate(
+            _surface_integrand(head, a), 0.0, np.sqrt(np.clip(h, a, b) - a), _piece_order(head, i)
+        )
 
-        return self.radius
+    return total
 
-    def area_at_height(self, h):
-        r = self.radius_at_height(h)
-        return math.pi * r**2
 
-    def volume_up_to(self, h, steps=500):
-        total = 0.0
-        dh = (h - self.h1) / steps
-        for i in range(steps):
-            hi = self.h1 + i * dh
-            total += self.area_at_height(hi) * dh
-        return total
+# ============================================================
+#  Torispherical Head (crown + knuckle)
+# ============================================================
 
-    def max_head_volume(self):
-        return self.volume_up_to(self.h3)
+@lru_cache(maxsize=None)
+def _torispherical_ratios(major: float, minor: float) -> tuple:
+    """
+    Knuckle-centre height and crown/knuckle transition height, both divided
+    by D. They depend only on the crown and knuckle ratios, so the trig runs
+    once per head proportion rather than once per head.
+    """
+    a = major - minor   # crown-to-knuckle centre distance / D
+    b = 0.5 - minor     # knuckle centre radial offset / D
 
+    hp2 = major - math.sqrt(a**2 - b**2)
+    alpha = math.asin(b / a)
+    h2 = major - math.cos(alpha) * major
+    return hp2, h2
 
-# ============================================================
-#  Elliptical 2:1 Head
-# ============================================================
 
-@dataclass
-class Elliptical2to1Head:
-    diameter: float
-    thickness: float
+@dataclass(frozen=True, slots=True)
+class TorisphericalHead:
+    diameter: float      # external diameter (m)
+    thickness: float     # wall thickness (m)
+    major: float         # crown radius / D
+    minor: float         # knuckle radius / D
+
+    # Derived geometry, set in __post_init__
+    crown_radius: float = _derived()
+    knuckle_radius: float = _derived()
+    radius: float = _derived()
+    c_height_offset: float = _derived()
+    c_radius_offset: float = _derived()
+    k_height_offset: float = _derived()
+    k_radius_offset: float = _derived()
+    h1: float = _derived()
+    h2: float = _derived()
+    h3: float = _derived()
+    _A_cyl: float = _derived()
+    _V_max: float = _derived()
+    _profile_breaks: tuple = _derived()
+    _profile_is_zone: tuple = _derived()
+    _A_cyl_per_m: float = _derived()
+    _A_wetted_full: float = _derived()
 
     def __post_init__(self):
+        # Frozen so the instances shared through vessel._build_head's cache
+        # cannot be mutated; derived fields are assigned with _set_fields
+
         # Validate dimensions
-        self.diameter, self.thickness = _validate_head_dimensions(
-            self.diameter, self.thickness
-        )
-        
-        # ASME 2:1 ellipsoidal proportions
-        self.major = 0.90
-        self.minor = 0.17
+        diameter, thickness = _validate_head_dimensions(self.diameter, self.thickness)
+        _set_fields(self, diameter=diameter, thickness=thickness)
 
         # External radii
         Rc_ext = self.major * self.diameter
         Rk_ext = self.minor * self.diameter
         R_ext  = self.diameter / 2
 
-        # External geometry
-        a_ext = Rc_ext - Rk_ext
-        b_ext = R_ext - Rk_ext
+        # External geometry, scaled from the dimensionless proportions
+        hp2_over_D, h2_over_D = _torispherical_ratios(self.major, self.minor)
 
         rp2_ext = (self.diameter - 2 * Rk_ext) / 2
-        hp2_ext = Rc_ext - math.sqrt(a_ext**2 - b_ext**2)
-
-        # Internal radii
-        self.crown_radius   = Rc_ext - self.thickness
-        self.knuckle_radius = Rk_ext - self.thickness
-        self.radius         = R_ext  - self.thickness
-
-        # Internal circle centers
-        self.c_height_offset = Rc_ext
-        self.c_radius_offset = 0.0
-
-        self.k_height_offset = hp2_ext
-        self.k_radius_offset = rp2_ext
+        hp2_ext = hp2_over_D * self.diameter
+
+        _set_fields(
+            self,
+            # Internal radii (thin-wall approximation)
+            crown_radius=Rc_ext - self.thickness,
+            knuckle_radius=Rk_ext - self.thickness,
+            radius=R_ext - self.thickness,
+
+            # Internal circle centers (same as external)
+            c_height_offset=Rc_ext,
+            c_radius_offset=0.0,
+            k_height_offset=hp2_ext,
+            k_radius_offset=rp2_ext,
+
+            # Transition heights
+            h1=0.0,
+            h2=h2_over_D * self.diameter,
+            h3=hp2_ext,
+        )
 
-        # Transition heights
-        self.h1 = 0.0
-        alpha_ext = math.asin(rp2_ext / (Rc_ext - Rk_ext))
-        self.h2 = Rc_ext - math.cos(alpha_ext) * Rc_ext
-        self.h3 = self.k_height_offset
+        # Cached invariants
+        _set_fields(self, _A_cyl=math.pi * self.radius**2)
+        _set_fields(self, _V_max=self.volume_up_to(self.h3))
 
+        # Heights where the wall profile is not smooth (region changes and
+        # the points where a clamped circle term starts), for piecewise quadrature
+        edges = (
+            self.c_height_offset - abs(self.crown_radius),
+            self.k_height_offset - abs(self.knuckle_radius),
+        )
+        breaks = tuple(sorted(
+            {self.h1, self.h2, self.h3} | {e for e in edges if self.h1 < e < self.h3}
+        ))
+
+        # Pieces below h2 (spherical crown) or below the knuckle clamp edge
+        # (constant radius) are zones whose area grows linearly in height
+        _set_fields(
+            self,
+            _profile_breaks=breaks,
+            _profile_is_zone=tuple(b <= self.h2 or b <= edges[1] for b in breaks[1:]),
+            _A_cyl_per_m=2 * math.pi * self.radius,
+        )
+        _set_fields(self, _A_wetted_full=self.wetted_area_up_to(self.h3))
 
     # --------------------------------------------------------
 
     def radius_at_height(self, h):
+        """Internal radius at height h inside the head."""
+        # R² - d² is evaluated as (R - d)(R + d): one multiply, and no
+        # cancellation when d is close to R
         if h <= self.h2:
-            val = self.crown_radius**2 - (h - self.c_height_offset)**2
+            d = h - self.c_height_offset
+            val = (self.crown_radius - d) * (self.crown_radius + d)
             return math.sqrt(max(val, 0.0)) + self.c_radius_offset
 
         if h <= self.h3:
-            val = self.knuckle_radius**2 - (h - self.k_height_offset)**2
+            d = h - self.k_height_offset
+            val = (self.knuckle_radius - d) * (self.knuckle_radius + d)
             return math.sqrt(max(val, 0.0)) + self.k_radius_offset
 
         return self.radius
@@ -184,48 +323,134 @@ class Elliptical2to1Head:
         r = self.radius_at_height(h)
         return math.pi * r**2
 
-    def volume_up_to(self, h, steps=500):
-        total = 0.0
-        dh = (h - self.h1) / steps
-        for i in range(steps):
-            hi = self.h1 + i * dh
-            total += self.area_at_height(hi) * dh
+    def volume_up_to(self, h, steps=None):
+        """
+        Volume (m³) from h1 up to height h, integrated in closed form over
+        the crown, knuckle and any straight section above h3.
+        `steps` is deprecated and ignored.
+        """
+        _warn_steps_ignored(steps)
+        if h <= self.h1:
+            return 0.0
+
+        total = _circle_band_volume(
+            self.crown_radius, self.c_height_offset, self.c_radius_offset,
+            self.h1, min(h, self.h2),
+        )
+        if h > self.h2:
+            total += _circle_band_volume(
+                self.knuckle_radius, self.k_height_offset, self.k_radius_offset,
+                self.h2, min(h, self.h3),
+            )
+        if h > self.h3:
+            total += math.pi * self.radius**2 * (h - self.h3)
         return total
 
     def max_head_volume(self):
-        return self.volume_up_to(self.h3)
+        return self._V_max
+
+    def wetted_area_up_to(self, h):
+        """Wetted surface area (m²) from h1 up to height h."""
+        return _surface_area_up_to(self, h)
+
+    def wetted_area_up_to_vec(self, h):
+        return _surface_area_up_to_vec(self, h)
+
+    def _r_and_drdh_vec(self, h):
+        """Radius and dr/dh at an array of heights, blended by region without branching."""
+        h = np.asarray(h, dtype=np.float64)
+        r_c, dr_c = _circle_profile_vec(
+            h, self.crown_radius, self.c_height_offset, self.c_radius_offset
+        )
+        r_k, dr_k = _circle_profile_vec(
+            h, self.knuckle_radius, self.k_height_offset, self.k_radius_offset
+        )
+
+        crown = h <= self.h2
+        knuckle = h <= self.h3
+        r = np.where(crown, r_c, np.where(knuckle, r_k, self.radius))
+        dr_dh = np.where(crown, dr_c, np.where(knuckle, dr_k, 0.0))
+        return r, dr_dh
+
+
+# ============================================================
+#  ASME F&D Head
+# ============================================================
+
+@dataclass(frozen=True, slots=True)
+class ASMEFDHead(TorisphericalHead):
+    # ASME F&D proportions
+    major: float = field(default=1.00, init=False)
+    minor: float = field(default=0.06, init=False)
+
+
+# ============================================================
+#  Elliptical 2:1 Head
+# ============================================================
+
+@dataclass(frozen=True, slots=True)
+class Elliptical2to1Head(TorisphericalHead):
+    # ASME 2:1 ellipsoidal proportions
+    major: float = field(default=0.90, init=False)
+    minor: float = field(default=0.17, init=False)
 
 
 # ============================================================
 #  Hemispherical Head
 # ============================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HemisphericalHead:
     diameter: float
     thickness: float
 
+    # Derived geometry, set in __post_init__
+    radius: float = _derived()
+    head_depth: float = _derived()
+    h1: float = _derived()
+    h2: float = _derived()
+    h3: float = _derived()
+    _A_cyl: float = _derived()
+    _V_max: float = _derived()
+    _A_cyl_per_m: float = _derived()
+    _A_wetted_full: float = _derived()
+
     def __post_init__(self):
+        # Frozen like TorisphericalHead; derived fields use _set_fields
+
         # Validate dimensions
-        self.diameter, self.thickness = _validate_head_dimensions(
-            self.diameter, self.thickness
+        diameter, thickness = _validate_head_dimensions(self.diameter, self.thickness)
+
+        # Internal sphere radius; hemisphere depth = radius
+        radius = diameter / 2 - thickness
+
+        _set_fields(
+            self,
+            diameter=diameter,
+            thickness=thickness,
+            radius=radius,
+            head_depth=radius,
+
+            # Integration limits (h3 = head height, named as on torispherical heads)
+            h1=0.0,
+            h2=radius,
+            h3=radius,
+
+            # Cached invariants
+            _A_cyl=math.pi * radius**2,
+            _A_cyl_per_m=2 * math.pi * radius,
+        )
+        _set_fields(
+            self,
+            _V_max=self.volume_up_to(self.h2),
+            _A_wetted_full=self.wetted_area_up_to(self.h2),
         )
-        
-        # Internal sphere radius
-        self.radius = self.diameter / 2 - self.thickness
-
-        # Hemisphere depth = radius
-        self.head_depth = self.radius
-
-        # Integration limits
-        self.h1 = 0.0
-        self.h2 = self.head_depth
 
     # --------------------------------------------------------
 
     def radius_at_height(self, h):
         if h <= self.h2:
-            val = self.radius**2 - (self.radius - h)**2
+            val = h * (2 * self.radius - h)  # R² - (R - h)²
             return math.sqrt(max(val, 0.0))
         return self.radius
 
@@ -233,13 +458,41 @@ class HemisphericalHead:
         r = self.radius_at_height(h)
         return math.pi * r**2
 
-    def volume_up_to(self, h, steps=500):
-        total = 0.0
-        dh = (h - self.h1) / steps
-        for i in range(steps):
-            hi = self.h1 + i * dh
-            total += self.area_at_height(hi) * dh
+    def volume_up_to(self, h, steps=None):
+        """
+        Volume (m³) from h1 up to height h: spherical cap π·h²·(R − h/3),
+        plus a straight section above h2. `steps` is deprecated and ignored.
+        """
+        _warn_steps_ignored(steps)
+        if h <= self.h1:
+            return 0.0
+
+        hc = min(h, self.h2)
+        total = math.pi * hc**2 * (self.radius - hc / 3)
+        if h > self.h2:
+            total += math.pi * self.radius**2 * (h - self.h2)
         return total
 
     def max_head_volume(self):
-        return self.volume_up_to(self.h2)
+        return self._V_max
+
+    def wetted_area_up_to(self, h):
+        """
+        Wetted area (m²) from h1 up to height h. A spherical zone of height h
+        has area 2πR·h (Archimedes), so no integration is needed.
+        """
+        if h <= self.h1:
+            return 0.0
+        return 2 * math.pi * self.radius * min(h, self.h2)
+
+    def wetted_area_up_to_vec(self, h):
+        h = np.asarray(h, dtype=np.float64)
+        return 2 * math.pi * self.radius * np.clip(h, self.h1, self.h2)
+
+    def _r_and_drdh_vec(self, h):
+        """Radius and dr/dh at an array of heights."""
+        h = np.asarray(h, dtype=np.float64)
+        r_cap, dr_cap = _circle_profile_vec(h, self.radius, self.radius, 0.0)
+
+        cap = h <= self.h2
+        return np.where(cap, r_cap, self.radius), np.where(cap, dr_cap, 0.0)
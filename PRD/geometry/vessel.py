@@ -1,46 +1,33 @@
-import math
-from geometry.heads import ASMEFDHead, Elliptical2to1Head, HemisphericalHead
+from functools import lru_cache, partial
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from geometry.heads import ASMEFDHead, Elliptical2to1Head, HemisphericalHead, _warn_steps_ignored
+from utils import _floats
 
 
 # ------------------------------------------------------------
 # Input Validation Helpers
 # ------------------------------------------------------------
 
-def _validate_positive(value: float, name: str) -> float:
-    """Validate that a value is positive."""
-    if value is None:
-        raise ValueError(f"{name} is required and cannot be None.")
-    try:
-        val = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
-    if val <= 0:
-        raise ValueError(f"{name} must be positive, got: {val}")
-    return val
+_validate_positive = partial(_floats._validate_positive, missing=_floats.MISSING_NOT_NONE)
+_validate_non_negative = partial(
+    _floats._validate_non_negative,
+    missing=_floats.MISSING_NOT_NONE,
+    negative="{name} must be non-negative, got: {value}",
+)
 
 
-def _validate_non_negative(value: float, name: str) -> float:
-    """Validate that a value is non-negative."""
-    if value is None:
-        raise ValueError(f"{name} is required and cannot be None.")
-    try:
-        val = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
-    if val < 0:
-        raise ValueError(f"{name} must be non-negative, got: {val}")
-    return val
-
+# ------------------------------------------------------------
+# Result types
+# ------------------------------------------------------------
 
-def _validate_positive_int(value: int, name: str, min_val: int = 1) -> int:
-    """Validate that a value is a positive integer."""
-    try:
-        val = int(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid integer, got: {value}")
-    if val < min_val:
-        raise ValueError(f"{name} must be at least {min_val}, got: {val}")
-    return val
+class WettedAreaResult(NamedTuple):
+    """Fire-case wetted area and liquid heights for a given fill volume."""
+    wetted_area_m2: float            # wetted surface area exposed to fire (m²)
+    liquid_height_m: float           # liquid height from vessel bottom (m)
+    liquid_height_exposed_m: float   # liquid height exposed to fire (m)
 
 
 # ------------------------------------------------------------
@@ -55,7 +42,7 @@ def wetted_area_firecase(
     thickness_mm: float,
     bottom_height_m: float,
     fire_height_m: float,
-    steps: int = 500,
+    steps: Optional[int] = None,
 ) -> float:
     """
     Fire-case wetted area for a vertical vessel.
@@ -69,7 +56,9 @@ def wetted_area_firecase(
       - fire_height_m: flame height above grade (m)
 
     Returns wetted area (m²) from vessel bottom up to the fire height.
+    `steps` is deprecated and ignored.
     """
+    _warn_steps_ignored(steps)
 
     # Validate orientation
     if orientation is None or not isinstance(orientation, str):
@@ -93,7 +82,6 @@ def wetted_area_firecase(
     L_tangent_m = _validate_non_negative(L_tangent_m, "Tangent length (L_tangent_m)")
     bottom_height_m = _validate_non_negative(bottom_height_m, "Bottom height (bottom_height_m)")
     fire_height_m = _validate_non_negative(fire_height_m, "Fire height (fire_height_m)")
-    steps = _validate_positive_int(steps, "Integration steps", min_val=10)
 
     # Check thickness vs radius
     thickness_m = thickness_mm / 1000.0
@@ -110,34 +98,35 @@ def wetted_area_firecase(
         return 0.0
 
     # Clamp to total vessel height (bottom head + shell + top head)
-    H_head = getattr(head, "h3", head.h2)
+    H_head = head.h3
     H_total = H_head + L_tangent_m + H_head
     H_liquid = min(H_liquid, H_total)
 
-    return wetted_area_up_to_height(H_liquid, head, L_tangent_m, steps)
+    return wetted_area_up_to_height(H_liquid, head, L_tangent_m)
 
 
 def wetted_area_from_volume(
     V_m3: float,
     head,
     shell_height_m: float,
-    steps: int = 500,
+    steps: Optional[int] = None,
 ) -> float:
     """
     Total wetted area (m²) of a vertical vessel given a liquid volume (m³).
     Includes bottom head, cylindrical shell, and top head.
+    `steps` is deprecated and ignored.
     """
+    _warn_steps_ignored(steps)
 
     # Validate inputs
     V_m3 = _validate_non_negative(V_m3, "Volume (V_m3)")
     shell_height_m = _validate_non_negative(shell_height_m, "Shell height (shell_height_m)")
-    steps = _validate_positive_int(steps, "Integration steps", min_val=10)
 
     if head is None:
         raise ValueError("Head object is required and cannot be None.")
 
     H = liquid_height_from_volume(V_m3, head, shell_height_m)
-    return wetted_area_up_to_height(H, head, shell_height_m, steps)
+    return wetted_area_up_to_height(H, head, shell_height_m)
 
 
 def wetted_area_from_fill_volume(
@@ -149,61 +138,35 @@ def wetted_area_from_fill_volume(
     bottom_height_m: float,
     fire_height_m: float,
     fill_volume_m3: float,
-    steps: int = 500,
-) -> dict:
+    steps: Optional[int] = None,
+) -> WettedAreaResult:
     """
     Calculate wetted area for fire case based on normal fill volume.
     
     The wetted area is the surface area of the vessel wetted by liquid,
     limited by the fire height above grade.
     
-    Returns a dict with:
+    Returns a WettedAreaResult with:
+      - wetted_area_m2: wetted surface area exposed to fire (m²)
       - liquid_height_m: total height of liquid in vessel from vessel bottom
       - liquid_height_exposed_m: height of liquid exposed to fire
-      - wetted_area_m2: wetted surface area exposed to fire (m²)
-    """
-    
-    # Validate orientation
-    if orientation is None or not isinstance(orientation, str):
-        raise ValueError("Vessel orientation is required and must be a string.")
-    if orientation != "Vertical":
-        raise ValueError(
-            f"Only 'Vertical' orientation is supported, got: '{orientation}'. "
-            f"Horizontal vessels are not yet implemented."
-        )
 
-    # Validate head type
-    valid_head_types = ["ASME_FD", "Ellipsoidal", "Hemispherical"]
-    if head_type not in valid_head_types:
-        raise ValueError(
-            f"Head type must be one of {valid_head_types}, got: '{head_type}'"
-        )
+    `steps` is deprecated and ignored.
+    """
+    _warn_steps_ignored(steps)
 
-    # Validate dimensions
-    OD_m = _validate_positive(OD_m, "Error with Outer Diameter input")
-    thickness_mm = _validate_non_negative(thickness_mm, "Error with Shell Thickness input")
-    L_tangent_m = _validate_non_negative(L_tangent_m, "Error with Shell Height input")
-    bottom_height_m = _validate_non_negative(bottom_height_m, "Error with Surface to Vessel Bottom Height input")
-    fire_height_m = _validate_non_negative(fire_height_m, "Error with Fire Height input")
+    OD_m, thickness_mm, L_tangent_m, bottom_height_m, fire_height_m = _validate_fill_case(
+        orientation, head_type, L_tangent_m, OD_m, thickness_mm,
+        bottom_height_m, fire_height_m,
+    )
     fill_volume_m3 = _validate_non_negative(fill_volume_m3, "Error with Normal Fill Volume input")
-    steps = _validate_positive_int(steps, "Integration steps", min_val=10)
-
-    # Check thickness vs radius
-    thickness_m = thickness_mm / 1000.0
-    if thickness_m >= OD_m / 2:
-        raise ValueError(
-            f"Wall thickness ({thickness_mm} mm) must be less than radius ({OD_m/2*1000:.1f} mm)."
-        )
 
     head = _build_head(head_type, OD_m, thickness_mm)
-    H_head = getattr(head, "h3", head.h2)
+    H_head = head.h3
     H_total = H_head + L_tangent_m + H_head
     
     # Calculate maximum vessel volume
-    V_head = head.max_head_volume()
-    R = head.radius
-    A_cyl = math.pi * R**2
-    V_max = V_head * 2 + A_cyl * L_tangent_m  # Both heads + cylinder
+    V_max = _vessel_capacity(head, L_tangent_m)
     
     # Validate fill volume doesn't exceed vessel capacity
     if fill_volume_m3 > V_max:
@@ -224,33 +187,132 @@ def wetted_area_from_fill_volume(
     
     if fire_limit_from_vessel_bottom <= 0:
         # Fire doesn't reach the vessel
-        return {
-            "liquid_height_m": liquid_height_m,
-            "liquid_height_exposed_m": 0.0,
-            "wetted_area_m2": 0.0,
-        }
+        return WettedAreaResult(0.0, liquid_height_m, 0.0)
     
     # Exposed liquid height is limited by both liquid level and fire height
     liquid_height_exposed_m = min(liquid_height_m, fire_limit_from_vessel_bottom)
     
     # Calculate wetted area up to the exposed liquid height
-    wetted_area_m2 = wetted_area_up_to_height(liquid_height_exposed_m, head, L_tangent_m, steps)
+    wetted_area_m2 = wetted_area_up_to_height(liquid_height_exposed_m, head, L_tangent_m)
     
-    return {
-        "liquid_height_m": liquid_height_m,
-        "liquid_height_exposed_m": liquid_height_exposed_m,
-        "wetted_area_m2": wetted_area_m2,
-    }
+    return WettedAreaResult(wetted_area_m2, liquid_height_m, liquid_height_exposed_m)
+
+
+def wetted_area_from_fill_volume_batch(
+    orientation: str,
+    head_type: str,
+    L_tangent_m: float,
+    OD_m: float,
+    thickness_mm: float,
+    bottom_height_m: float,
+    fire_height_m: float,
+    fill_volumes_m3,
+    steps: Optional[int] = None,
+) -> WettedAreaResult:
+    """
+    Vectorized wetted_area_from_fill_volume for parametric sweeps over fill volume.
+    The vessel is fixed; fill_volumes_m3 is an array-like of volumes (m³).
+    Returns a WettedAreaResult whose fields are float64 arrays shaped like
+    fill_volumes_m3. `steps` is deprecated and ignored.
+    """
+    _warn_steps_ignored(steps)
+
+    OD_m, thickness_mm, L_tangent_m, bottom_height_m, fire_height_m = _validate_fill_case(
+        orientation, head_type, L_tangent_m, OD_m, thickness_mm,
+        bottom_height_m, fire_height_m,
+    )
+    V = np.asarray(fill_volumes_m3, dtype=np.float64)
+    if np.any(V < 0):
+        raise ValueError(
+            f"Error with Normal Fill Volume input must be non-negative, got: {V.min()}"
+        )
+
+    head = _build_head(head_type, OD_m, thickness_mm)
+
+    V_max = _vessel_capacity(head, L_tangent_m)
+    if np.any(V > V_max):
+        raise ValueError(
+            f"Error with Normal Fill Volume input: Volume of {V.max():.3f} m³ exceeds "
+            f"vessel capacity of {V_max:.3f} m³. Please enter a smaller fill volume."
+        )
+
+    liquid_height_m = liquid_height_from_volume_vec(V, head, L_tangent_m)
+
+    fire_limit_from_vessel_bottom = fire_height_m - bottom_height_m
+    if fire_limit_from_vessel_bottom <= 0:
+        zeros = np.zeros_like(liquid_height_m)
+        return WettedAreaResult(zeros, liquid_height_m, zeros.copy())
+
+    liquid_height_exposed_m = np.minimum(liquid_height_m, fire_limit_from_vessel_bottom)
+    wetted_area_m2 = wetted_area_up_to_height_vec(liquid_height_exposed_m, head, L_tangent_m)
+
+    return WettedAreaResult(wetted_area_m2, liquid_height_m, liquid_height_exposed_m)
+
+
+def _validate_fill_case(
+    orientation,
+    head_type,
+    L_tangent_m,
+    OD_m,
+    thickness_mm,
+    bottom_height_m,
+    fire_height_m,
+) -> tuple:
+    """
+    Shared input validation for the fill-volume APIs.
+    Returns (OD_m, thickness_mm, L_tangent_m, bottom_height_m, fire_height_m).
+    """
+
+    # Validate orientation
+    if orientation is None or not isinstance(orientation, str):
+        raise ValueError("Vessel orientation is required and must be a string.")
+    if orientation != "Vertical":
+        raise ValueError(
+            f"Only 'Vertical' orientation is supported, got: '{orientation}'. "
+            f"Horizontal vessels are not yet implemented."
+        )
+
+    # Validate head type
+    valid_head_types = ["ASME_FD", "Ellipsoidal", "Hemispherical"]
+    if head_type not in valid_head_types:
+        raise ValueError(
+            f"Head type must be one of {valid_head_types}, got: '{head_type}'"
+        )
+
+    # Validate dimensions
+    OD_m = _validate_positive(OD_m, "Error with Outer Diameter input")
+    thickness_mm = _validate_non_negative(thickness_mm, "Error with Shell Thickness input")
+    L_tangent_m = _validate_non_negative(L_tangent_m, "Error with Shell Height input")
+    bottom_height_m = _validate_non_negative(bottom_height_m, "Error with Surface to Vessel Bottom Height input")
+    fire_height_m = _validate_non_negative(fire_height_m, "Error with Fire Height input")
+
+    # Check thickness vs radius
+    thickness_m = thickness_mm / 1000.0
+    if thickness_m >= OD_m / 2:
+        raise ValueError(
+            f"Wall thickness ({thickness_mm} mm) must be less than radius ({OD_m/2*1000:.1f} mm)."
+        )
+
+    return OD_m, thickness_mm, L_tangent_m, bottom_height_m, fire_height_m
+
+
+def _vessel_capacity(head, L_tangent_m: float) -> float:
+    """Total vessel volume (m³): both heads plus the cylindrical shell."""
+    return head.max_head_volume() * 2 + head._A_cyl * L_tangent_m
 
 
 # ------------------------------------------------------------
 # Head construction
 # ------------------------------------------------------------
 
+@lru_cache(maxsize=128)
 def _build_head(head_type: str, OD_m: float, thickness_mm: float):
     """
     Factory for head objects based on head_type string.
     Uses OD in m and thickness in mm (converted to m).
+
+    Memoized on the raw arguments, so sweeps over one vessel share a single
+    head; callers must treat the returned head as read-only.
     """
 
     # Validate inputs
@@ -289,11 +351,13 @@ def wetted_area_up_to_height(
     H: float,
     head,
     shell_height: float,
-    steps: int = 500,
+    steps: Optional[int] = None,
 ) -> float:
     """
     Wetted area (m²) up to a given liquid height H from vessel bottom.
+    `steps` is deprecated and ignored.
     """
+    _warn_steps_ignored(steps)
 
     # Validate inputs
     if head is None:
@@ -315,29 +379,50 @@ def wetted_area_up_to_height(
     if shell_height < 0:
         raise ValueError("shell_height must be non-negative.")
 
-    R = head.radius
-    H_head = getattr(head, "h3", head.h2)  # h3 for torispherical, h2 for hemispherical
-    H_shell = shell_height
+    H_head = head.h3
+    A_head_full = head._A_wetted_full
 
-    # Case 1: liquid entirely inside bottom head
-    if H <= H_head:
-        return head_wetted_area_up_to(H, head, steps)
+    # Liquid height split into bottom head, cylinder and top head parts
+    H_bot = min(H, H_head)
+    H_cyl = min(max(H - H_head, 0.0), shell_height)
+    H_top = min(max(H - H_head - shell_height, 0.0), H_head)
 
-    # Case 2: bottom head full, liquid in cylinder
-    if H <= H_head + H_shell:
-        A_head_bottom = head_wetted_area_up_to(H_head, head, steps)
-        h_cyl = H - H_head
-        A_cyl = 2 * math.pi * R * h_cyl
-        return A_head_bottom + A_cyl
+    A_bot = A_head_full if H_bot >= H_head else head.wetted_area_up_to(H_bot)
+    A_top = A_head_full if H_top >= H_head else head.wetted_area_up_to(H_top)
 
-    # Case 3: cylinder full, liquid in top head
-    A_head_bottom = head_wetted_area_up_to(H_head, head, steps)
-    A_cyl = 2 * math.pi * R * H_shell
+    return A_bot + head._A_cyl_per_m * H_cyl + A_top
 
-    h_in_top = H - (H_head + H_shell)
-    A_head_top = head_wetted_area_up_to(h_in_top, head, steps)
 
-    return A_head_bottom + A_cyl + A_head_top
+def wetted_area_up_to_height_vec(
+    H,
+    head,
+    shell_height: float,
+    steps: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Vectorized wetted_area_up_to_height over an array of liquid heights H (m).
+    Each height is split into bottom-head, shell and top-head parts; the head
+    integrals are evaluated once per distinct head height.
+    `steps` is deprecated and ignored.
+    """
+    _warn_steps_ignored(steps)
+    H = np.maximum(np.asarray(H, dtype=np.float64), 0.0)
+
+    H_head = head.h3
+    H_shell = shell_height
+
+    H_bot = np.minimum(H, H_head)
+    H_cyl = np.clip(H - H_head, 0.0, H_shell)
+    H_top = np.clip(H - H_head - H_shell, 0.0, H_head)
+
+    heights, inverse = np.unique(
+        np.concatenate((H_bot.ravel(), H_top.ravel())), return_inverse=True
+    )
+    A_head = head.wetted_area_up_to_vec(heights)[inverse.ravel()]
+    A_bot = A_head[:H.size].reshape(H.shape)
+    A_top = A_head[H.size:].reshape(H.shape)
+
+    return A_bot + head._A_cyl_per_m * H_cyl + A_top
 
 
 # ------------------------------------------------------------
@@ -354,8 +439,8 @@ def liquid_height_from_volume(
     """
 
     V_head = head.max_head_volume()
-    A_cyl = math.pi * head.radius**2
-    H_head = getattr(head, "h3", head.h2)
+    A_cyl = head._A_cyl
+    H_head = head.h3
     H_shell = shell_height_m
 
     # Case 1: volume entirely in bottom head
@@ -375,6 +460,39 @@ def liquid_height_from_volume(
     return H_head + H_shell + h_in_top
 
 
+def liquid_height_from_volume_vec(
+    V_m3,
+    head,
+    shell_height_m: float,
+) -> np.ndarray:
+    """
+    Vectorized liquid_height_from_volume over an array of volumes (m³).
+    Shell fills are solved in closed form; head fills are solved once per
+    distinct volume.
+    """
+    V = np.asarray(V_m3, dtype=np.float64)
+
+    V_head = head.max_head_volume()
+    A_cyl = head._A_cyl
+    H_head = head.h3
+    H_shell = shell_height_m
+
+    in_bottom = V <= V_head
+    in_top = V - V_head > A_cyl * H_shell
+
+    # Case 2 everywhere, then overwrite the head cases
+    H = H_head + (V - V_head) / A_cyl
+
+    in_head = in_bottom | in_top
+    if np.any(in_head):
+        V_in_head = np.where(in_bottom, V, V - V_head - A_cyl * H_shell)[in_head]
+        volumes, inverse = np.unique(V_in_head, return_inverse=True)
+        h_solved = np.array([solve_height_in_head(v, head) for v in volumes])[inverse.ravel()]
+        H[in_head] = np.where(in_bottom[in_head], h_solved, H_head + H_shell + h_solved)
+
+    return H
+
+
 # ------------------------------------------------------------
 # Solve height in head for partial volume
 # ------------------------------------------------------------
@@ -386,22 +504,39 @@ def solve_height_in_head(
 ) -> float:
     """
     Height inside a head (m) that corresponds to a given volume (m³).
-    Binary search between h1 and h3 (or h2 for hemispherical).
+    Safeguarded Newton iteration on V(h) - V_target with dV/dh = area_at_height,
+    falling back to bisection between h1 and h3
+    whenever a Newton step leaves the bracket. `steps` caps the iterations.
     """
 
     low = head.h1
-    high = getattr(head, "h3", head.h2)
+    high = head.h3
+
+    if V_target <= 0.0:
+        return low
+    if V_target >= head.max_head_volume():
+        return high
+
+    tol = 1e-9 * V_target
+    h = min(max(V_target / head._A_cyl, low), high)
 
     for _ in range(steps):
-        mid = 0.5 * (low + high)
-        V_mid = head.volume_up_to(mid)
+        dV = head.volume_up_to(h) - V_target
+        if abs(dV) <= tol:
+            break
 
-        if V_mid < V_target:
-            low = mid
+        if dV < 0:
+            low = h
         else:
-            high = mid
+            high = h
+
+        A = head.area_at_height(h)
+        h_next = h - dV / A if A > 0.0 else low
+        if not low < h_next < high:
+            h_next = 0.5 * (low + high)
+        h = h_next
 
-    return 0.5 * (low + high)
+    return h
 
 
 # ------------------------------------------------------------
@@ -411,32 +546,25 @@ def solve_height_in_head(
 def head_wetted_area_up_to(
     h: float,
     head,
-    steps: int = 500,
+    steps: Optional[int] = None,
 ) -> float:
     """
     Wetted surface area (m²) of a head from h1 up to height h
-    using surface-of-revolution integration.
+    using surface-of-revolution integration (see head.wetted_area_up_to).
+    `steps` is deprecated and ignored.
     """
+    _warn_steps_ignored(steps)
+    return head.wetted_area_up_to(h)
 
-    h_low = head.h1
-    h_high = min(h, getattr(head, "h3", head.h2))
-
-    if h <= h_low:
-        return 0.0
 
-    dh = (h_high - h_low) / steps
-    total = 0.0
-
-    for i in range(steps):
-        hi = h_low + i * dh
-
-        r = head.radius_at_height(hi)
-
-        h_forward = min(hi + 1e-5, h_high)
-        r_forward = head.radius_at_height(h_forward)
-        dr_dh = (r_forward - r) / (h_forward - hi) if h_forward != hi else 0.0
-
-        dA = 2 * math.pi * r * math.sqrt(1 + dr_dh**2) * dh
-        total += dA
-
-    return total
\ No newline at end of file
+def head_wetted_area_up_to_vec(
+    h,
+    head,
+    steps: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Vectorized head_wetted_area_up_to over a 1-D array of heights h (m).
+    `steps` is deprecated and ignored.
+    """
+    _warn_steps_ignored(steps)
+    return head.wetted_area_up_to_vec(h)
\ No newline at end of file
@@ -1,5 +1,8 @@
+from bisect import bisect_left
 import math
 
+import numpy as np
+
 # API orifice table (area in square inches)
 API_ORIFICES = {
     "D": 0.110,
@@ -46,6 +49,25 @@ def get_orifice_diameter(area_in2: float) -> float:
     return 2.0 * math.sqrt(area_in2 / math.pi)
 
 
+# Orifice records prebuilt once, sorted by area, plus the areas for binary search
+_ORIFICE_RECORDS = tuple(
+    {
+        "letter": letter,
+        "area_in2": API_ORIFICES[letter],
+        "diameter_in": get_orifice_diameter(API_ORIFICES[letter]),
+        "inlet_size_in": API_INLET_SIZES[letter],
+    }
+    for letter in sorted(API_ORIFICES, key=API_ORIFICES.get)
+)
+_SORTED_AREAS = tuple(record["area_in2"] for record in _ORIFICE_RECORDS)
+
+# The same table as index-aligned arrays, for np.searchsorted in the batch path
+_ORIFICE_COLUMNS = {
+    key: np.array([record[key] for record in _ORIFICE_RECORDS])
+    for key in ("letter", "area_in2", "diameter_in", "inlet_size_in")
+}
+
+
 def select_orifice(A_required_in2: float) -> dict:
     """
     Returns the smallest API orifice letter that meets or exceeds the required area.
@@ -62,29 +84,44 @@ def select_orifice(A_required_in2: float) -> dict:
     
     if A_required_in2 < 0:
         raise ValueError(f"Required area cannot be negative, got: {A_required_in2} in²")
-    
-    if A_required_in2 == 0:
-        # Return smallest orifice for zero area requirement
-        return {
-            "letter": "D",
-            "area_in2": API_ORIFICES["D"],
-            "diameter_in": get_orifice_diameter(API_ORIFICES["D"]),
-            "inlet_size_in": API_INLET_SIZES["D"],
-        }
-    
-    # Find suitable orifice
-    for letter, area in sorted(API_ORIFICES.items(), key=lambda x: x[1]):
-        if area >= A_required_in2:
-            return {
-                "letter": letter,
-                "area_in2": area,
-                "diameter_in": get_orifice_diameter(area),
-                "inlet_size_in": API_INLET_SIZES[letter],
-            }
-    
+
+    # Copy so callers can't mutate the shared table
+    return dict(_select_orifice(A_required_in2))
+
+
+def _select_orifice(A_required_in2: float) -> dict:
+    """
+    select_orifice on an already-validated, non-negative float area.
+    Returns the shared table record; callers must not mutate it.
+    """
     # If no orifice is large enough, provide helpful message
-    raise ValueError(
-        f"No standard API orifice can accommodate required area: {A_required_in2:.3f} in². "
-        f"Maximum available is 'T' at {MAX_ORIFICE_AREA} in². "
-        f"Consider multiple relief devices or a rupture disc."
-    )
+    if not A_required_in2 <= MAX_ORIFICE_AREA:
+        raise ValueError(
+            f"No standard API orifice can accommodate required area: {A_required_in2:.3f} in². "
+            f"Maximum available is 'T' at {MAX_ORIFICE_AREA} in². "
+            f"Consider multiple relief devices or a rupture disc."
+        )
+
+    # Smallest orifice with area >= required (zero area selects the smallest)
+    return _ORIFICE_RECORDS[bisect_left(_SORTED_AREAS, A_required_in2)]
+
+
+def select_orifice_batch(A_required_in2) -> dict:
+    """
+    Vectorized select_orifice for parametric sweeps.
+    A_required_in2 is an array-like of required areas (in²); returns a dict
+    with the same keys as select_orifice whose values are arrays shaped
+    like A_required_in2.
+    """
+    A = np.asarray(A_required_in2, dtype=np.float64)
+    if np.any(A < 0):
+        raise ValueError(f"Required area cannot be negative, got: {A.min()} in²")
+    if not np.all(A <= MAX_ORIFICE_AREA):
+        raise ValueError(
+            f"No standard API orifice can accommodate required area: {np.nanmax(A):.3f} in². "
+            f"Maximum available is 'T' at {MAX_ORIFICE_AREA} in². "
+            f"Consider multiple relief devices or a rupture disc."
+        )
+
+    idx = np.searchsorted(_ORIFICE_COLUMNS["area_in2"], A, side="left")
+    return {key: column[idx] for key, column in _ORIFICE_COLUMNS.items()}
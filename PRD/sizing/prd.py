@@ -1,17 +1,57 @@
-from fire.api2000 import heat_load_api2000
-from fire.api520 import heat_load_api520
-
-from flow.evaporation import evaporation_rate_kg_per_hr
-from flow.area import required_area_critical_gas, required_area_subcritical_gas
-from flow.pressures import (
-    max_accumulation,
-    relieving_pressure,
-    critical_downstream_pressure,
-    downstream_pressure,
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from typing import NamedTuple
+
+import numpy as np
+
+from fire.api2000 import heat_load_api2000, heat_load_api2000_batch, _heat_load_api2000_cached
+from fire.api520 import (
+    heat_load_api520, heat_load_api520_batch, _heat_load_api520_cached,
+    _parse_firefighting, _parse_firefighting_batch,
+)
+
+from flow.area import (
+    _validate_k,
+    _validate_compressibility,
+    _required_area_critical_gas,
+    _required_area_subcritical_gas,
+    _C_gas_batch,
+    _F2_subcritical_batch,
 )
+from flow.pressures import is_critical, _critical_pressure_ratio
 
-from sizing.orifice import select_orifice
-from utils.units import kg_hr_to_lb_hr, C_to_R
+from sizing.orifice import _select_orifice, select_orifice_batch
+from utils.units import C_to_R, KG_TO_LB, _safe_float, _validate_celsius
+from utils._floats import _validate_positive, _validate_non_negative, _validate_factor
+
+
+# ============================================================
+#  RESULT TYPE
+# ============================================================
+
+class PsvSizingResult(NamedTuple):
+    """Fire-case PSV sizing results."""
+    Q_dot_W: float               # fire heat load (W)
+    m_kg_hr: float               # evaporation rate (kg/hr)
+    W_lb_hr: float               # relieving mass flow (lb/hr)
+    P1_psia: float               # relieving pressure (psia)
+    critical: bool               # True if flow through the PSV is critical
+    A_required_in2: float        # required PSV area (in²)
+    orifice_letter: str          # selected API orifice letter
+    orifice_area_in2: float      # selected orifice area (in²)
+    orifice_diameter_in: float   # effective orifice diameter (in)
+    inlet_size_in: float         # API 526 inlet size (in)
+
+
+def stack_results(results) -> PsvSizingResult:
+    """
+    Stack a sequence of scalar PsvSizingResults (e.g. from a Monte Carlo
+    loop over size_psv_for_fire) into one PsvSizingResult whose fields are
+    arrays, the same layout size_psv_for_fire_batch returns.
+    """
+    if not results:
+        return PsvSizingResult(*(np.empty(0) for _ in PsvSizingResult._fields))
+    return PsvSizingResult(*(np.array(column) for column in zip(*results)))
 
 
 # ============================================================
@@ -21,30 +61,81 @@ from utils.units import kg_hr_to_lb_hr, C_to_R
 VALID_FIRE_STANDARDS = ["API2000", "API520"]
 
 
-def _validate_positive(value: float, name: str) -> float:
-    """Validate that a value is positive."""
-    if value is None:
-        raise ValueError(f"{name} is required.")
-    try:
-        value = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
-    if value <= 0:
-        raise ValueError(f"{name} must be positive, got: {value}")
-    return value
-
-
-def _validate_non_negative(value: float, name: str) -> float:
-    """Validate that a value is non-negative."""
-    if value is None:
-        raise ValueError(f"{name} is required.")
-    try:
-        value = float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
-    if value < 0:
-        raise ValueError(f"{name} cannot be negative, got: {value}")
-    return value
+# Per-field validators for PsvInputs, run in field order. Each takes the raw
+# value and returns it as a validated float. Inputs read by only one fire
+# standard (P_design_barg, firefighting) are checked in __post_init__.
+_PSV_INPUT_VALIDATORS = {
+    "A_wetted_m2": partial(_validate_non_negative, name="Wetted area (A_wetted_m2)"),
+    "h_fg_J_per_kg": partial(_validate_positive, name="Enthalpy of vaporization (h_fg_J_per_kg)"),
+    "k": _validate_k,
+    "Z": _validate_compressibility,
+    "M_lb_per_lbmol": partial(_validate_positive, name="Molecular weight (M)"),
+    "T_C": _validate_celsius,
+    "MAWP_psig": partial(_validate_positive, name="MAWP (psig)"),
+    "atm_psia": partial(_validate_positive, name="Atmospheric pressure (psia)"),
+    "accum_percent": partial(
+        _validate_factor, name="Accumulation percent", max_val=100.0,
+        exceeds="{name} should not exceed 100%, got: {value}%",
+    ),
+    "backpressure_psig": partial(_validate_non_negative, name="Backpressure (psig)"),
+    "Kd": partial(_validate_factor, name="Discharge coefficient (Kd)", max_val=1.0),
+    "Kb": partial(_validate_factor, name="Backpressure factor (Kb)", max_val=1.0),
+    "Kc": partial(_validate_factor, name="Combination factor (Kc)", max_val=1.0),
+    "Ke": partial(_validate_factor, name="Environmental factor (Ke)", max_val=2.0),  # Ke can exceed 1
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PsvInputs:
+    """
+    Inputs to the fire-case PSV sizing, validated once on construction.
+    Numeric fields are stored as floats; downstream math does not re-check them.
+    """
+    A_wetted_m2: float
+    fire_standard: str
+    P_design_barg: float
+    firefighting: bool
+    h_fg_J_per_kg: float
+    k: float
+    Z: float
+    M_lb_per_lbmol: float
+    T_C: float
+    MAWP_psig: float
+    atm_psia: float
+    accum_percent: float
+    backpressure_psig: float
+    Kd: float
+    Kb: float
+    Kc: float
+    Ke: float
+
+    def __post_init__(self):
+        if self.fire_standard not in VALID_FIRE_STANDARDS:
+            if not isinstance(self.fire_standard, str):
+                raise ValueError("Fire sizing standard is required.")
+            raise ValueError(
+                f"Unknown fire sizing standard: '{self.fire_standard}'. "
+                f"Valid options are: {VALID_FIRE_STANDARDS}"
+            )
+
+        # Each standard only validates its own input: API2000 reads the
+        # design pressure, API520 the firefighting flag
+        if self.fire_standard == "API2000":
+            object.__setattr__(
+                self, "P_design_barg",
+                _safe_float(self.P_design_barg, "Design pressure (P_design_barg)"),
+            )
+        else:
+            object.__setattr__(self, "firefighting", _parse_firefighting(self.firefighting))
+
+        for name, validate in _PSV_INPUT_VALIDATORS.items():
+            object.__setattr__(self, name, validate(getattr(self, name)))
+
+
+def _check_batch(values: np.ndarray, ok: np.ndarray, message: str) -> None:
+    """Raise ValueError naming the first offending value if any of ok is False."""
+    if not np.all(ok):
+        raise ValueError(f"{message}, got: {values[~ok].flat[0]}")
 
 
 # ============================================================
@@ -60,6 +151,10 @@ def fire_heat_load(
     """
     Dispatches to API2000 or API520 fire heat load calculation.
     Returns heat load in Watts.
+
+    Standalone convenience wrapper: size_psv_from_inputs makes the same
+    dispatch on validated PsvInputs and calls the cached table lookups
+    directly, so both give the same heat load.
     """
     # Validate standard
     if standard is None or not isinstance(standard, str):
@@ -95,11 +190,12 @@ def is_critical_flow(
 ) -> bool:
     """
     Determines if flow is critical using API520 critical downstream pressure.
+
+    Standalone convenience wrapper around flow.pressures.is_critical, which
+    validates its inputs; _size_psv_core evaluates the same comparison on
+    already-validated floats.
     """
-    # Validation is done in the called functions
-    P_crit = critical_downstream_pressure(P1_psia, k)
-    P_down = downstream_pressure(P_back_psig, atm_psia)
-    return P_crit > P_down
+    return is_critical(P1_psia, P_back_psig, atm_psia, k)
 
 
 # ============================================================
@@ -135,99 +231,241 @@ def size_psv_for_fire(
     5. Required PSV area (in²)
     6. Orifice selection
     
-    All inputs are validated at this top level and in downstream functions.
+    Inputs are validated once by building a PsvInputs.
     """
+    return size_psv_from_inputs(PsvInputs(
+        A_wetted_m2, fire_standard, P_design_barg, firefighting,
+        h_fg_J_per_kg, k, Z, M_lb_per_lbmol, T_C,
+        MAWP_psig, atm_psia, accum_percent, backpressure_psig,
+        Kd, Kb, Kc, Ke,
+    ))
 
-    # --------------------------------------------------------
-    # Validate critical inputs upfront for better error messages
-    # --------------------------------------------------------
-    A_wetted_m2 = _validate_non_negative(A_wetted_m2, "Wetted area (A_wetted_m2)")
-    h_fg_J_per_kg = _validate_positive(h_fg_J_per_kg, "Enthalpy of vaporization (h_fg_J_per_kg)")
-    
-    # Validate k (specific heat ratio)
-    k = _validate_positive(k, "Specific heat ratio (k)")
-    if k <= 1.0:
-        raise ValueError(
-            f"Specific heat ratio (k) must be > 1.0 for real gases, got: {k}"
-        )
-    
-    # Validate Z (compressibility)
-    Z = _validate_positive(Z, "Compressibility factor (Z)")
-    
-    # Validate molecular weight
-    M_lb_per_lbmol = _validate_positive(M_lb_per_lbmol, "Molecular weight (M)")
-    
-    # Validate pressures
-    MAWP_psig = _validate_positive(MAWP_psig, "MAWP (psig)")
-    atm_psia = _validate_positive(atm_psia, "Atmospheric pressure (psia)")
-    backpressure_psig = _validate_non_negative(backpressure_psig, "Backpressure (psig)")
-    accum_percent = _validate_positive(accum_percent, "Accumulation percent")
-    
-    # Validate correction factors
-    Kd = _validate_positive(Kd, "Discharge coefficient (Kd)")
-    Kb = _validate_positive(Kb, "Backpressure factor (Kb)")
-    Kc = _validate_positive(Kc, "Combination factor (Kc)")
-    Ke = _validate_positive(Ke, "Environmental factor (Ke)")
+
+def size_psv_from_inputs(inputs: PsvInputs) -> PsvSizingResult:
+    """Run the fire-case PSV sizing pipeline on already-validated PsvInputs."""
 
     # --------------------------------------------------------
     # 1) Fire heat load (W)
     # --------------------------------------------------------
-    Q_dot_W = fire_heat_load(
-        fire_standard,
-        A_wetted_m2,
-        P_design_barg,
-        firefighting
+    if inputs.fire_standard == "API2000":
+        Q_dot_W = _heat_load_api2000_cached(inputs.A_wetted_m2, inputs.P_design_barg)
+    else:
+        Q_dot_W = _heat_load_api520_cached(inputs.A_wetted_m2, inputs.firefighting)
+
+    T_R = C_to_R(inputs.T_C, _checked=True)
+
+    return _size_psv_core(
+        Q_dot_W, inputs.h_fg_J_per_kg, inputs.k, inputs.Z, inputs.M_lb_per_lbmol, T_R,
+        inputs.MAWP_psig, inputs.atm_psia, inputs.accum_percent, inputs.backpressure_psig,
+        inputs.Kd, inputs.Kb, inputs.Kc, inputs.Ke,
     )
 
-    # --------------------------------------------------------
-    # 2) Evaporation rate (kg/hr)
-    # --------------------------------------------------------
-    m_kg_hr = evaporation_rate_kg_per_hr(Q_dot_W, h_fg_J_per_kg)
 
-    # Convert to lb/hr for API520 equations
-    W_lb_hr = kg_hr_to_lb_hr(m_kg_hr)
+@lru_cache(maxsize=128)
+def _size_psv_core(
+    Q_dot_W: float,
+    h_fg_J_per_kg: float,
+    k: float,
+    Z: float,
+    M_lb_per_lbmol: float,
+    T_R: float,
+    MAWP_psig: float,
+    atm_psia: float,
+    accum_percent: float,
+    backpressure_psig: float,
+    Kd: float,
+    Kb: float,
+    Kc: float,
+    Ke: float,
+) -> PsvSizingResult:
+    """
+    Steps 2-6 of size_psv_for_fire on already-validated floats.
+    Plain arithmetic only; the one remaining check (backpressure below the
+    relieving pressure) depends on values computed here. The result is an
+    immutable tuple, so memoized results can be shared between callers.
+    """
 
-    # Convert temperature to Rankine
-    T_R = C_to_R(T_C)
+    # --------------------------------------------------------
+    # 2) Evaporation rate (kg/hr), then lb/hr for API520 equations
+    # --------------------------------------------------------
+    m_kg_hr = Q_dot_W / h_fg_J_per_kg * 3600.0
+    W_lb_hr = m_kg_hr * KG_TO_LB
 
     # --------------------------------------------------------
     # 3) Relieving pressure (psia)
     # --------------------------------------------------------
-    accum_psig = max_accumulation(MAWP_psig, accum_percent)
-    P1_psia = relieving_pressure(MAWP_psig, atm_psia, accum_psig)
+    # MAWP plus accumulation plus atmospheric, as one multiply-add
+    P1_psia = MAWP_psig * (1.0 + accum_percent * 0.01) + atm_psia
 
     # --------------------------------------------------------
     # 4) Criticality check
     # --------------------------------------------------------
-    critical = is_critical_flow(P1_psia, backpressure_psig, atm_psia, k)
+    P2_psia = backpressure_psig + atm_psia
+    critical = _critical_pressure_ratio(k) * P1_psia > P2_psia
 
     # --------------------------------------------------------
     # 5) Required PSV area (in²)
     # --------------------------------------------------------
-    if critical:
-        A_req = required_area_critical_gas(
+    if W_lb_hr == 0:
+        A_req = 0.0  # No flow means no area required
+    elif critical:
+        A_req = _required_area_critical_gas(
             W_lb_hr, k, T_R, Z, M_lb_per_lbmol, P1_psia, Kd, Kb, Kc
         )
     else:
-        P2_psia = downstream_pressure(backpressure_psig, atm_psia)
-        A_req = required_area_subcritical_gas(
+        if P2_psia >= P1_psia:
+            raise ValueError(
+                f"Backpressure ({P2_psia} psia) must be less than relieving pressure ({P1_psia} psia)."
+            )
+        A_req = _required_area_subcritical_gas(
             W_lb_hr, k, T_R, Z, M_lb_per_lbmol, P1_psia, P2_psia, Kd, Ke
         )
 
     # --------------------------------------------------------
     # 6) Orifice selection
     # --------------------------------------------------------
-    orifice = select_orifice(A_req)
-
-    return {
-        "Q_dot_W": Q_dot_W,
-        "m_kg_hr": m_kg_hr,
-        "W_lb_hr": W_lb_hr,
-        "P1_psia": P1_psia,
-        "critical": critical,
-        "A_required_in2": A_req,
-        "orifice_letter": orifice["letter"],
-        "orifice_area_in2": orifice["area_in2"],
-        "orifice_diameter_in": orifice["diameter_in"],
-        "inlet_size_in": orifice["inlet_size_in"],
-    }
+    orifice = _select_orifice(A_req)
+
+    return PsvSizingResult(
+        Q_dot_W,
+        m_kg_hr,
+        W_lb_hr,
+        P1_psia,
+        critical,
+        A_req,
+        orifice["letter"],
+        orifice["area_in2"],
+        orifice["diameter_in"],
+        orifice["inlet_size_in"],
+    )
+
+
+# ============================================================
+#  BATCH FIRE-CASE PSV SIZING
+# ============================================================
+
+def size_psv_for_fire_batch(
+    A_wetted_m2,
+    fire_standard: str,
+    P_design_barg,
+    firefighting,
+    h_fg_J_per_kg,
+    k,
+    Z,
+    M_lb_per_lbmol,
+    T_C,
+    MAWP_psig,
+    atm_psia,
+    accum_percent,
+    backpressure_psig,
+    Kd,
+    Kb,
+    Kc,
+    Ke,
+) -> PsvSizingResult:
+    """
+    Vectorized size_psv_for_fire for parametric and uncertainty sweeps.
+
+    fire_standard applies to the whole batch; every other input is a scalar
+    or array-like, broadcast against each other. Inputs are checked in bulk
+    against the same limits as the scalar pipeline. Returns a PsvSizingResult
+    whose fields are arrays.
+    """
+    if fire_standard not in VALID_FIRE_STANDARDS:
+        raise ValueError(
+            f"Unknown fire sizing standard: '{fire_standard}'. "
+            f"Valid options are: {VALID_FIRE_STANDARDS}"
+        )
+
+    # Each standard only reads its own input, as in the scalar pipeline;
+    # firefighting flags are parsed element-wise to accept the same strings
+    if fire_standard == "API520":
+        firefighting = _parse_firefighting_batch(firefighting)
+        P_design_barg = 0.0
+    else:
+        firefighting = False
+
+    (firefighting, A, P_design, h_fg, k, Z, M, T_C, MAWP, atm, accum, P_back,
+     Kd, Kb, Kc, Ke) = np.broadcast_arrays(
+        np.asarray(firefighting, dtype=bool),
+        *(np.asarray(x, dtype=np.float64) for x in (
+            A_wetted_m2, P_design_barg, h_fg_J_per_kg, k, Z,
+            M_lb_per_lbmol, T_C, MAWP_psig, atm_psia, accum_percent,
+            backpressure_psig, Kd, Kb, Kc, Ke,
+        ))
+    )
+
+    # --------------------------------------------------------
+    # Bulk validation (same limits as the scalar pipeline)
+    # --------------------------------------------------------
+    _check_batch(A, A >= 0, "Wetted area (A_wetted_m2) cannot be negative")
+    _check_batch(h_fg, h_fg > 0, "Enthalpy of vaporization (h_fg_J_per_kg) must be positive")
+    _check_batch(k, (k > 1.0) & (k <= 2.0), "Specific heat ratio (k) must be > 1.0 and at most 2.0")
+    _check_batch(Z, (Z > 0) & (Z <= 2.0), "Compressibility factor (Z) must be positive and at most 2.0")
+    _check_batch(M, M > 0, "Molecular weight (M) must be positive")
+    _check_batch(T_C, T_C >= -273.15, "Temperature cannot be below absolute zero (-273.15°C)")
+    _check_batch(MAWP, MAWP > 0, "MAWP (psig) must be positive")
+    _check_batch(atm, atm > 0, "Atmospheric pressure (psia) must be positive")
+    _check_batch(P_back, P_back >= 0, "Backpressure (psig) cannot be negative")
+    _check_batch(accum, (accum > 0) & (accum <= 100), "Accumulation percent must be in (0, 100]")
+    _check_batch(Kd, (Kd > 0) & (Kd <= 1.0), "Discharge coefficient (Kd) must be in (0, 1]")
+    _check_batch(Kb, (Kb > 0) & (Kb <= 1.0), "Backpressure factor (Kb) must be in (0, 1]")
+    _check_batch(Kc, (Kc > 0) & (Kc <= 1.0), "Combination factor (Kc) must be in (0, 1]")
+    _check_batch(Ke, (Ke > 0) & (Ke <= 2.0), "Environmental factor (Ke) must be in (0, 2]")
+
+    # --------------------------------------------------------
+    # 1-2) Fire heat load (W) and evaporation rate
+    # --------------------------------------------------------
+    if fire_standard == "API2000":
+        Q_dot_W = heat_load_api2000_batch(A, P_design)
+    else:
+        Q_dot_W = heat_load_api520_batch(A, firefighting)
+
+    m_kg_hr = Q_dot_W / h_fg * 3600.0
+    W_lb_hr = m_kg_hr * KG_TO_LB
+    T_R = C_to_R(T_C, _checked=True)
+
+    # --------------------------------------------------------
+    # 3-4) Relieving pressure and criticality
+    # --------------------------------------------------------
+    P1_psia = MAWP * (1.0 + accum * 0.01) + atm
+    P2_psia = P_back + atm
+    critical = (2.0 / (k + 1.0)) ** (k / (k - 1.0)) * P1_psia > P2_psia
+
+    # Rows without flow need no area, so skip the backpressure check there
+    flowing = W_lb_hr != 0
+    _check_batch(
+        P2_psia, critical | (P2_psia < P1_psia) | ~flowing,
+        "Backpressure (psia) must be less than relieving pressure",
+    )
+
+    # --------------------------------------------------------
+    # 5) Required PSV area (in²), both equations then select
+    # --------------------------------------------------------
+    A_crit = W_lb_hr * np.sqrt(T_R * Z / M) / (_C_gas_batch(k) * Kd * P1_psia * Kb * Kc)
+
+    # Critical rows may carry r outside (0, 1); their F2 is discarded
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r = P2_psia / P1_psia
+        F2 = _F2_subcritical_batch(k, r)
+        A_sub = W_lb_hr * np.sqrt(Z * T_R / (M * P1_psia * (P1_psia - P2_psia))) / (735.0 * F2 * Kd * Ke)
+
+    A_req = np.where(flowing, np.where(critical, A_crit, A_sub), 0.0)
+
+    # --------------------------------------------------------
+    # 6) Orifice selection
+    # --------------------------------------------------------
+    orifice = select_orifice_batch(A_req)
+
+    return PsvSizingResult(
+        Q_dot_W,
+        m_kg_hr,
+        W_lb_hr,
+        P1_psia,
+        critical,
+        A_req,
+        orifice["letter"],
+        orifice["area_in2"],
+        orifice["diameter_in"],
+        orifice["inlet_size_in"],
+    )
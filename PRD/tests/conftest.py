@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The app imports its packages relative to PRD/ (e.g. `from sizing.prd import ...`)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
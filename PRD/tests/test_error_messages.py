@@ -0,0 +1,42 @@
+import pytest
+
+from flow.pressures import critical_downstream_pressure
+from geometry.vessel import wetted_area_firecase
+from sizing.prd import size_psv_for_fire
+from utils._floats import _validate_factor, _validate_non_negative, _validate_positive
+from utils.units import kg_hr_to_lb_hr
+
+VESSEL = dict(orientation="Vertical", head_type="ASME_FD", L_tangent_m=3.0, OD_m=2.0,
+              thickness_mm=10.0, bottom_height_m=1.0, fire_height_m=7.6)
+PSV = dict(A_wetted_m2=20.0, fire_standard="API520", P_design_barg=None, firefighting=False,
+           h_fg_J_per_kg=4.0e5, k=1.3, Z=0.9, M_lb_per_lbmol=44.0, T_C=80.0, MAWP_psig=50.0,
+           atm_psia=14.7, accum_percent=21.0, backpressure_psig=0.0, Kd=0.975, Kb=1.0, Kc=1.0, Ke=1.0)
+
+
+@pytest.mark.parametrize("call, message", [
+    (lambda: wetted_area_firecase(**{**VESSEL, "OD_m": None}),
+     "Outer diameter (OD_m) is required and cannot be None."),
+    (lambda: wetted_area_firecase(**{**VESSEL, "L_tangent_m": -1}),
+     "Tangent length (L_tangent_m) must be non-negative, got: -1.0"),
+    (lambda: kg_hr_to_lb_hr(None), "Mass flow (kg/hr) is required and cannot be None."),
+    (lambda: critical_downstream_pressure(100.0, "x"), "Specific heat ratio must be a valid number, got: x"),
+    (lambda: _validate_non_negative(-1, "Mass"), "Mass cannot be negative, got: -1.0"),
+    (lambda: size_psv_for_fire(**{**PSV, "accum_percent": 150}),
+     "Accumulation percent should not exceed 100%, got: 150.0%"),
+])
+def test_shared_validators_keep_module_wording(call, message):
+    with pytest.raises(ValueError) as exc:
+        call()
+    assert str(exc.value) == message
+
+
+@pytest.mark.parametrize("call, message", [
+    (lambda: _validate_positive(0, "Flow"), "Flow must be positive, got: 0.0"),
+    (lambda: _validate_positive(0, "Flow", positive="{name} needs > 0 ({value})"), "Flow needs > 0 (0.0)"),
+    (lambda: _validate_factor(1.5, "Kd"), "Kd should not exceed 1.0, got: 1.5"),
+    (lambda: _validate_factor(3, "Ke", max_val=2.0, exceeds="{name} over {max_val}: {value}"), "Ke over 2.0: 3.0"),
+])
+def test_shared_validator_templates_can_be_overridden(call, message):
+    with pytest.raises(ValueError) as exc:
+        call()
+    assert str(exc.value) == message
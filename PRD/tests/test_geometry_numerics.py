@@ -0,0 +1,102 @@
+import math
+
+import numpy as np
+import pytest
+
+from geometry.heads import (
+    ASMEFDHead,
+    HemisphericalHead,
+    _circle_band_volume,
+    _surface_area_up_to,
+    _surface_integrand,
+    gauss_integrate,
+)
+from geometry.vessel import (
+    _build_head,
+    _vessel_capacity,
+    head_wetted_area_up_to,
+    liquid_height_from_volume,
+    solve_height_in_head,
+    wetted_area_from_volume,
+    wetted_area_from_fill_volume,
+    wetted_area_from_fill_volume_batch,
+    wetted_area_up_to_height,
+)
+
+R = 1.0
+
+
+def test_gauss_integrate_is_exact_for_polynomials():
+    # An n-point rule is exact up to degree 2n - 1
+    assert gauss_integrate(lambda x: x**5 - 2 * x**2 + 1, 0.0, 2.0, 3) == pytest.approx(32 / 3 - 16 / 3 + 2)
+
+
+@pytest.mark.parametrize("h", [0.05, 0.3, 0.7, R])
+def test_hemisphere_surface_quadrature_matches_zone_area(h):
+    head = HemisphericalHead(2 * R, 0.0)
+    area = gauss_integrate(_surface_integrand(head, 0.0), 0.0, math.sqrt(h))
+    assert float(area) == pytest.approx(2 * math.pi * R * h, rel=1e-12)
+
+
+@pytest.mark.parametrize("fraction", [0.1, 0.5, 1.0])
+def test_torispherical_crown_area_matches_zone_area(fraction):
+    head = ASMEFDHead(2 * R, 0.0)
+    h = fraction * head.h2
+    assert _surface_area_up_to(head, h) == pytest.approx(2 * math.pi * head.crown_radius * h, rel=1e-12)
+
+
+@pytest.mark.parametrize("h", [0.1, 0.4, R])
+def test_circle_band_volume_matches_spherical_cap(h):
+    cap = math.pi * h**2 * (R - h / 3)
+    assert _circle_band_volume(R, R, 0.0, 0.0, h) == pytest.approx(cap, rel=1e-12)
+
+
+@pytest.mark.parametrize("head", [HemisphericalHead(2 * R, 0.0), ASMEFDHead(2.0, 0.01)])
+@pytest.mark.parametrize("fraction", [0.05, 0.3, 0.8, 0.999])
+def test_solve_height_in_head_inverts_volume(head, fraction):
+    h = fraction * head.h3
+    assert solve_height_in_head(head.volume_up_to(h), head) == pytest.approx(h, abs=1e-9)
+
+
+def test_solve_height_in_head_matches_hemisphere_cap():
+    head = HemisphericalHead(2 * R, 0.0)
+    h = 0.4
+    assert solve_height_in_head(math.pi * h**2 * (R - h / 3), head) == pytest.approx(h, abs=1e-9)
+
+
+def test_hemispherical_vessel_areas_match_sphere_and_cylinder():
+    head = HemisphericalHead(2 * R, 0.0)
+    L = 3.0
+
+    # Bottom head + 1.5 m of shell
+    assert wetted_area_up_to_height(R + 1.5, head, L) == pytest.approx(2 * math.pi * R * (R + 1.5))
+    # Full vessel: a sphere plus the cylinder wall
+    assert wetted_area_up_to_height(2 * R + L, head, L) == pytest.approx(4 * math.pi * R**2 + 2 * math.pi * R * L)
+
+    V_half = 2 / 3 * math.pi * R**3 + math.pi * R**2 * (L / 2)
+    assert liquid_height_from_volume(V_half, head, L) == pytest.approx(R + L / 2)
+    assert wetted_area_from_volume(V_half, head, L) == pytest.approx(2 * math.pi * R * (R + L / 2))
+
+
+@pytest.mark.parametrize("head_type", ["ASME_FD", "Ellipsoidal", "Hemispherical"])
+@pytest.mark.parametrize("fire_height_m", [0.5, 3.0, 12.0])
+def test_fill_volume_batch_matches_scalar(head_type, fire_height_m):
+    vessel = ("Vertical", head_type, 4.0, 2.0, 10.0, 1.0, fire_height_m)
+    V_max = _vessel_capacity(_build_head(head_type, 2.0, 10.0), 4.0)
+
+    # Bottom head, shell and top head fills, with repeats for the np.unique dedupe
+    V = V_max * np.array([0.0, 0.02, 0.3, 0.02, 0.6, 0.985, 1.0, 0.3])
+    batch = wetted_area_from_fill_volume_batch(*vessel, V)
+
+    for field in batch._fields:
+        expected = [getattr(wetted_area_from_fill_volume(*vessel, v), field) for v in V]
+        np.testing.assert_allclose(getattr(batch, field), expected, rtol=1e-12, atol=1e-12, err_msg=field)
+
+
+def test_steps_is_deprecated_and_ignored():
+    head = HemisphericalHead(2 * R, 0.0)
+    with pytest.warns(DeprecationWarning, match="steps"):
+        area = head_wetted_area_up_to(0.5, head, steps=10)
+    assert area == head_wetted_area_up_to(0.5, head)
+    with pytest.warns(DeprecationWarning, match="steps"):
+        assert head.volume_up_to(0.5, steps=10) == head.volume_up_to(0.5)
@@ -0,0 +1,25 @@
+import dataclasses
+
+import pytest
+
+from geometry.heads import ASMEFDHead, Elliptical2to1Head, HemisphericalHead
+from geometry.vessel import _build_head
+
+
+@pytest.mark.parametrize("head_type", ["ASME_FD", "Ellipsoidal", "Hemispherical"])
+def test_cached_heads_are_immutable(head_type):
+    head = _build_head(head_type, 2.0, 10.0)
+    assert _build_head(head_type, 2.0, 10.0) is head
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        head.h2 = 0.0
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        head.radius = 0.0
+
+
+@pytest.mark.parametrize("head_cls", [ASMEFDHead, Elliptical2to1Head, HemisphericalHead])
+def test_head_derived_fields_are_set(head_cls):
+    head = head_cls(2.0, 0.01)
+    assert head.radius == pytest.approx(0.99)
+    assert head.h1 == 0.0 < head.h2 <= head.h3
+    assert head._A_wetted_full == pytest.approx(head.wetted_area_up_to(head.h3))
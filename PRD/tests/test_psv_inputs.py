@@ -0,0 +1,25 @@
+import pytest
+
+from sizing.prd import PsvInputs
+
+
+BASE = dict(
+    A_wetted_m2=20.0, firefighting=False, h_fg_J_per_kg=4.0e5, k=1.3, Z=0.9,
+    M_lb_per_lbmol=44.0, T_C=80.0, MAWP_psig=50.0, atm_psia=14.7, accum_percent=21.0,
+    backpressure_psig=0.0, Kd=0.975, Kb=1.0, Kc=1.0, Ke=1.0,
+)
+
+
+def test_api520_does_not_require_design_pressure():
+    inputs = PsvInputs(fire_standard="API520", P_design_barg=None, **dict(BASE, firefighting="yes"))
+    assert inputs.firefighting is True
+
+
+def test_api2000_requires_design_pressure():
+    with pytest.raises(ValueError, match="Design pressure"):
+        PsvInputs(fire_standard="API2000", P_design_barg=None, **BASE)
+
+
+def test_api2000_ignores_firefighting_flag():
+    inputs = PsvInputs(fire_standard="API2000", P_design_barg="0.5", **dict(BASE, firefighting="maybe"))
+    assert inputs.P_design_barg == 0.5
@@ -0,0 +1,42 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+from utils.validation import ValidationError
+
+
+@pytest.fixture
+def app_module(monkeypatch):
+    # app mounts static/ and templates/ relative to the working directory
+    monkeypatch.chdir(Path(__file__).resolve().parents[1])
+    return importlib.import_module("app")
+
+
+REQUEST = dict(
+    fire_standard="API520", orientation="Vertical", head_type="ASME_FD",
+    tangent_length_m="3", outer_diameter_m="2", shell_thickness_mm="10",
+    bottom_height_m="1", normal_fill_volume_m3="5", h_fg_kJ_per_kg="400",
+    M_g_per_mol="44", k="1.3", Z="0.9", T_C="80", P_operating_psig="45",
+    MAWP_psig="50", accum_percent="21", firefighting="false",
+    Kd="0.975", Kb="1.0", Kc="1.0",
+)
+
+
+def test_parse_request_accepts_valid_request(app_module):
+    fields = app_module.parse_request(REQUEST)
+    assert fields["shell_thickness_mm"] == 10.0
+    assert fields["atm_psia"] == 14.7
+
+
+def test_thickness_error_reported_before_later_fields(app_module):
+    # A bad thickness and a bad later field: the thickness check runs first
+    data = dict(REQUEST, shell_thickness_mm="1500", k="abc")
+    with pytest.raises(ValidationError, match="Shell Thickness"):
+        app_module.parse_request(data)
+
+
+def test_earlier_field_errors_precede_thickness_check(app_module):
+    data = dict(REQUEST, shell_thickness_mm="1500", bottom_height_m="-1")
+    with pytest.raises(ValidationError, match="Bottom Height"):
+        app_module.parse_request(data)
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from sizing.prd import fire_heat_load, is_critical_flow, size_psv_for_fire, size_psv_for_fire_batch
+
+
+BASE = dict(
+    h_fg_J_per_kg=4.0e5, k=1.3, Z=0.9, M_lb_per_lbmol=44.0, T_C=80.0,
+    atm_psia=14.7, accum_percent=21.0, Kd=0.975, Kb=1.0, Kc=1.0, Ke=1.0,
+)
+
+
+def _assert_batch_matches_scalar(batch, scalars):
+    for field in batch._fields:
+        expected = [getattr(result, field) for result in scalars]
+        actual = getattr(batch, field).ravel().tolist()
+        if isinstance(expected[0], (bool, str)):
+            assert actual == expected, field
+        else:
+            np.testing.assert_allclose(actual, expected, rtol=1e-12, err_msg=field)
+
+
+@pytest.mark.parametrize("fire_standard", ["API2000", "API520"])
+@pytest.mark.parametrize("firefighting", [False, True])
+def test_batch_matches_scalar(fire_standard, firefighting):
+    # Covers critical and subcritical rows and every API2000 table row
+    A, MAWP, P_back = np.meshgrid([0.0, 5.0, 20.0, 100.0, 300.0], [5.0, 12.0, 50.0], [0.0, 3.0], indexing="ij")
+    h_fg = np.where(A > 50.0, 4.0e6, 4.0e5)
+    P_design = MAWP * 0.06
+
+    batch = size_psv_for_fire_batch(
+        A, fire_standard, P_design, firefighting, **dict(BASE, h_fg_J_per_kg=h_fg),
+        MAWP_psig=MAWP, backpressure_psig=P_back,
+    )
+    scalars = [
+        size_psv_for_fire(
+            float(A[i]), fire_standard, float(P_design[i]), firefighting,
+            **dict(BASE, h_fg_J_per_kg=float(h_fg[i])),
+            MAWP_psig=float(MAWP[i]), backpressure_psig=float(P_back[i]),
+        )
+        for i in np.ndindex(A.shape)
+    ]
+
+    assert batch.critical.any() and not batch.critical.all()
+    _assert_batch_matches_scalar(batch, scalars)
+
+
+def test_batch_zero_flow_skips_backpressure_check():
+    # Backpressure above the relieving pressure is fine when nothing flows
+    kwargs = dict(BASE, MAWP_psig=1.0, backpressure_psig=30.0)
+    batch = size_psv_for_fire_batch([0.0, 0.0], "API520", None, False, **kwargs)
+    scalar = size_psv_for_fire(0.0, "API520", None, False, **kwargs)
+
+    _assert_batch_matches_scalar(batch, [scalar, scalar])
+    assert batch.A_required_in2.tolist() == [0.0, 0.0]
+
+
+def test_batch_backpressure_check_on_flowing_rows():
+    kwargs = dict(BASE, MAWP_psig=1.0, backpressure_psig=30.0)
+    with pytest.raises(ValueError, match="Backpressure"):
+        size_psv_for_fire(5.0, "API520", None, False, **kwargs)
+    with pytest.raises(ValueError, match="Backpressure"):
+        size_psv_for_fire_batch([0.0, 5.0], "API520", None, False, **kwargs)
+
+
+def test_batch_temperature_limit_matches_scalar():
+    kwargs = dict(BASE, T_C=-273.15, MAWP_psig=50.0, backpressure_psig=0.0)
+    batch = size_psv_for_fire_batch([20.0], "API520", None, False, **kwargs)
+    _assert_batch_matches_scalar(batch, [size_psv_for_fire(20.0, "API520", None, False, **kwargs)])
+
+    kwargs["T_C"] = np.nextafter(-273.15, -np.inf)
+    with pytest.raises(ValueError, match="absolute zero"):
+        size_psv_for_fire(20.0, "API520", None, False, **kwargs)
+    with pytest.raises(ValueError, match="absolute zero"):
+        size_psv_for_fire_batch([20.0], "API520", None, False, **kwargs)
+
+
+def test_batch_accepts_firefighting_strings():
+    flags = ["true", "No", " yes ", "0"]
+    kwargs = dict(BASE, MAWP_psig=50.0, backpressure_psig=0.0)
+
+    batch = size_psv_for_fire_batch(20.0, "API520", None, flags, **kwargs)
+    scalars = [size_psv_for_fire(20.0, "API520", None, flag, **kwargs) for flag in flags]
+
+    _assert_batch_matches_scalar(batch, scalars)
+
+
+def test_batch_rejects_bad_firefighting_string():
+    with pytest.raises(ValueError, match="Firefighting"):
+        size_psv_for_fire_batch(
+            20.0, "API520", None, ["yes", "maybe"], **BASE, MAWP_psig=50.0, backpressure_psig=0.0,
+        )
+
+
+@pytest.mark.parametrize("fire_standard", ["API2000", "API520"])
+@pytest.mark.parametrize("firefighting", [False, True])
+@pytest.mark.parametrize("A", [0.0, 5.0, 20.0, 100.0, 300.0])
+@pytest.mark.parametrize("MAWP, P_back", [(5.0, 0.0), (12.0, 3.0), (50.0, 3.0), (50.0, 40.0)])
+def test_convenience_wrappers_match_pipeline(fire_standard, firefighting, A, MAWP, P_back):
+    result = size_psv_for_fire(
+        A, fire_standard, MAWP * 0.06, firefighting,
+        **dict(BASE, h_fg_J_per_kg=4.0e6 if A > 50.0 else 4.0e5),
+        MAWP_psig=MAWP, backpressure_psig=P_back,
+    )
+    assert fire_heat_load(fire_standard, A, MAWP * 0.06, firefighting) == result.Q_dot_W
+    assert is_critical_flow(result.P1_psia, P_back, BASE["atm_psia"], BASE["k"]) == result.critical
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from fire.api2000 import heat_load_api2000, heat_load_api2000_batch
+from fire.api520 import heat_load_api520, heat_load_api520_batch
+from sizing.orifice import API_ORIFICES, MAX_ORIFICE_AREA, select_orifice, select_orifice_batch
+
+
+def _around(values):
+    """Each breakpoint plus the neighbouring floats on either side."""
+    return [x for v in values for x in (np.nextafter(v, -np.inf), v, np.nextafter(v, np.inf))]
+
+
+@pytest.mark.parametrize("P", _around([0.07, 1.034]) + [0.0, 0.5, 5.0])
+def test_api2000_batch_matches_scalar_at_table_boundaries(P):
+    # Area breakpoints 18.6 / 93 / 260 m² and the pressure rows at 0.07 / 1.034 barg
+    A = [0.0, 5.0, 50.0, 150.0, 400.0] + _around([18.6, 93.0, 260.0])
+    expected = [heat_load_api2000(a, P) for a in A]
+    np.testing.assert_allclose(heat_load_api2000_batch(A, P), expected, rtol=1e-12)
+
+
+def test_select_orifice_batch_matches_scalar_at_table_boundaries():
+    A = [0.0] + _around(sorted(API_ORIFICES.values()))
+    A = [a for a in A if a <= MAX_ORIFICE_AREA]
+    batch = select_orifice_batch(A)
+    for key in ("letter", "area_in2", "diameter_in", "inlet_size_in"):
+        assert batch[key].tolist() == [select_orifice(a)[key] for a in A], key
+
+
+def test_select_orifice_batch_rejects_oversize_area():
+    with pytest.raises(ValueError, match="No standard API orifice"):
+        select_orifice_batch([1.0, np.nextafter(MAX_ORIFICE_AREA, np.inf)])
+
+
+@pytest.mark.parametrize("firefighting", [True, False, "true", "false", "Yes", " no ", "1", "0"])
+def test_api520_batch_matches_scalar(firefighting):
+    A = [0.0, 1.0, 10.0, 250.0]
+    expected = [heat_load_api520(a, firefighting) for a in A]
+    np.testing.assert_allclose(heat_load_api520_batch(A, firefighting), expected, rtol=1e-12)
+
+
+def test_api520_batch_parses_flags_elementwise():
+    flags = ["false", "true", False, "no"]
+    expected = [heat_load_api520(10.0, flag) for flag in flags]
+    np.testing.assert_allclose(heat_load_api520_batch([10.0] * 4, flags), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("firefighting", ["maybe", ["true", ""], None])
+def test_api520_batch_rejects_invalid_flags(firefighting):
+    with pytest.raises(ValueError, match="Firefighting"):
+        heat_load_api520_batch([10.0, 20.0], firefighting)
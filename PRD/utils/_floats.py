@@ -0,0 +1,57 @@
+"""
+Shared float validators for the calculation modules.
+Each returns the value as a float or raises ValueError with a descriptive message.
+Messages are str.format templates over {name} and {value} ({max_val} too for
+`exceeds`), so modules can keep their own wording.
+"""
+
+MISSING = "{name} is required."
+MISSING_NOT_NONE = "{name} is required and cannot be None."
+INVALID = "{name} must be a valid number, got: {value}"
+NEGATIVE = "{name} cannot be negative, got: {value}"
+POSITIVE = "{name} must be positive, got: {value}"
+EXCEEDS = "{name} should not exceed {max_val}, got: {value}"
+
+
+def _safe_float(value, name: str, missing: str = MISSING, invalid: str = INVALID) -> float:
+    """Convert a value to float."""
+    if type(value) is float:
+        return value
+    if value is None:
+        raise ValueError(missing.format(name=name, value=value))
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise ValueError(invalid.format(name=name, value=value))
+
+
+def _validate_positive(
+    value: float, name: str, missing: str = MISSING, positive: str = POSITIVE
+) -> float:
+    """Validate that a value is positive."""
+    if type(value) is not float:
+        value = _safe_float(value, name, missing)
+    if value <= 0:
+        raise ValueError(positive.format(name=name, value=value))
+    return value
+
+
+def _validate_non_negative(
+    value: float, name: str, missing: str = MISSING, negative: str = NEGATIVE
+) -> float:
+    """Validate that a value is non-negative."""
+    if type(value) is not float:
+        value = _safe_float(value, name, missing)
+    if value < 0:
+        raise ValueError(negative.format(name=name, value=value))
+    return value
+
+
+def _validate_factor(
+    value: float, name: str, min_val: float = 0.0, max_val: float = 1.0, exceeds: str = EXCEEDS
+) -> float:
+    """Validate a correction factor."""
+    value = _validate_positive(value, name)
+    if value > max_val:
+        raise ValueError(exceeds.format(name=name, value=value, max_val=max_val))
+    return value
@@ -1,15 +1,37 @@
+from functools import partial
+
+from utils import _floats
+
+
+# -----------------------------
+# Conversion constants
+# -----------------------------
+
+KG_TO_LB: float = 2.2046226218      # lb per kg
+LB_TO_KG: float = 1.0 / KG_TO_LB    # kg per lb
+R_PER_K: float = 1.8                # °R per K
+C_TO_R_OFFSET: float = 491.67       # °R at 0 °C (273.15 K × 1.8)
+PSI_TO_BAR: float = 0.0689476       # bar per psi
+BAR_TO_PSI: float = 14.5037738      # psi per bar
+ATM_BAR: float = 1.01325            # standard atmosphere (bar)
+ATM_BAR_IN_PSI: float = ATM_BAR * BAR_TO_PSI   # standard atmosphere (psi)
+
+
 # -----------------------------
 # Validation Helper
 # -----------------------------
 
-def _safe_float(value, name: str) -> float:
-    """Safely convert value to float with helpful error message."""
-    if value is None:
-        raise ValueError(f"{name} is required and cannot be None.")
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        raise ValueError(f"{name} must be a valid number, got: {value}")
+_safe_float = partial(_floats._safe_float, missing=_floats.MISSING_NOT_NONE)
+
+
+def _validate_celsius(T_C) -> float:
+    """Convert a Celsius temperature to float and check it is above absolute zero."""
+    T_C = _safe_float(T_C, "Temperature (°C)")
+    if T_C < -273.15:
+        raise ValueError(
+            f"Temperature cannot be below absolute zero (-273.15°C), got: {T_C}°C"
+        )
+    return T_C
 
 
 # -----------------------------
@@ -21,7 +43,7 @@ def kg_hr_to_lb_hr(m_kg_hr: float) -> float:
     m_kg_hr = _safe_float(m_kg_hr, "Mass flow (kg/hr)")
     if m_kg_hr < 0:
         raise ValueError(f"Mass flow cannot be negative, got: {m_kg_hr} kg/hr")
-    return m_kg_hr * 2.2046226218
+    return m_kg_hr * KG_TO_LB
 
 
 def lb_hr_to_kg_hr(m_lb_hr: float) -> float:
@@ -29,7 +51,7 @@ def lb_hr_to_kg_hr(m_lb_hr: float) -> float:
     m_lb_hr = _safe_float(m_lb_hr, "Mass flow (lb/hr)")
     if m_lb_hr < 0:
         raise ValueError(f"Mass flow cannot be negative, got: {m_lb_hr} lb/hr")
-    return m_lb_hr / 2.2046226218
+    return m_lb_hr * LB_TO_KG
 
 
 # -----------------------------
@@ -38,22 +60,18 @@ def lb_hr_to_kg_hr(m_lb_hr: float) -> float:
 
 def C_to_K(T_C: float) -> float:
     """Convert temperature from Celsius to Kelvin."""
-    T_C = _safe_float(T_C, "Temperature (°C)")
-    if T_C < -273.15:
-        raise ValueError(
-            f"Temperature cannot be below absolute zero (-273.15°C), got: {T_C}°C"
-        )
+    T_C = _validate_celsius(T_C)
     return T_C + 273.15
 
 
-def C_to_R(T_C: float) -> float:
-    """Convert temperature from Celsius to Rankine."""
-    T_C = _safe_float(T_C, "Temperature (°C)")
-    if T_C < -273.15:
-        raise ValueError(
-            f"Temperature cannot be below absolute zero (-273.15°C), got: {T_C}°C"
-        )
-    return (T_C + 273.15) * 9.0 / 5.0
+def C_to_R(T_C: float, _checked: bool = False) -> float:
+    """
+    Convert temperature from Celsius to Rankine.
+    _checked=True skips validation for a T_C already run through _validate_celsius.
+    """
+    if not _checked:
+        T_C = _validate_celsius(T_C)
+    return T_C * R_PER_K + C_TO_R_OFFSET
 
 
 def K_to_R(T_K: float) -> float:
@@ -63,7 +81,7 @@ def K_to_R(T_K: float) -> float:
         raise ValueError(
             f"Temperature in Kelvin cannot be negative, got: {T_K} K"
         )
-    return T_K * 9.0 / 5.0
+    return T_K * R_PER_K
 
 
 # -----------------------------
@@ -74,14 +92,23 @@ def barg_to_psia(P_barg: float) -> float:
     """Convert pressure from barg to psia."""
     P_barg = _safe_float(P_barg, "Pressure (barg)")
     # Absolute pressure must be positive
-    P_bara = P_barg + 1.01325
-    if P_bara <= 0:
+    if P_barg <= -ATM_BAR:
         raise ValueError(
             f"Absolute pressure cannot be zero or negative. "
-            f"Got {P_barg} barg = {P_bara:.4f} bara"
+            f"Got {P_barg} barg = {P_barg + ATM_BAR:.4f} bara"
         )
-    # 1 bar = 14.5037738 psi
-    return P_bara * 14.5037738
+    # (P_barg + ATM_BAR) * BAR_TO_PSI as a single multiply-add
+    return P_barg * BAR_TO_PSI + ATM_BAR_IN_PSI
+
+
+def psig_to_barg(P_psig: float, _checked: bool = False) -> float:
+    """
+    Convert gauge pressure from psig to barg.
+    _checked=True skips the float conversion for an already-parsed value.
+    """
+    if not _checked:
+        P_psig = _safe_float(P_psig, "Pressure (psig)")
+    return P_psig * PSI_TO_BAR
 
 
 def psig_to_psia(P_psig: float) -> float:
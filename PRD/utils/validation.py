@@ -10,7 +10,7 @@ from typing import Any, Optional, Tuple, List
 
 class ValidationError(Exception):
     """Custom exception for validation errors with user-friendly messages."""
-    pass
+    __slots__ = ()
 
 
 def safe_float(value: Any, name: str, default: float = 0.0) -> float:
@@ -18,6 +18,9 @@ def safe_float(value: Any, name: str, default: float = 0.0) -> float:
     Safely convert a value to float.
     Returns the float value or raises ValidationError with a descriptive message.
     """
+    if type(value) is float:
+        return value
+
     if value is None:
         raise ValidationError(f"Error with {name} input: This field is required and cannot be empty.")
     
@@ -125,6 +128,12 @@ def validate_choice(value: Any, name: str, valid_choices: List[str]) -> str:
     return str_value
 
 
+# Accepted boolean spellings, with common capitalizations so most inputs
+# match without lowercasing
+_TRUTHY = frozenset({"true", "True", "TRUE", "1", "yes", "Yes", "YES", "on", "On", "ON"})
+_FALSY = frozenset({"false", "False", "FALSE", "0", "no", "No", "NO", "off", "Off", "OFF"})
+
+
 def validate_boolean(value: Any, name: str) -> bool:
     """
     Safely convert a value to boolean.
@@ -140,10 +149,14 @@ def validate_boolean(value: Any, name: str) -> bool:
         return bool(value)
     
     if isinstance(value, str):
+        if value in _TRUTHY:
+            return True
+        if value in _FALSY:
+            return False
         lower = value.lower().strip()
-        if lower in ("true", "1", "yes", "on"):
+        if lower in _TRUTHY:
             return True
-        if lower in ("false", "0", "no", "off"):
+        if lower in _FALSY:
             return False
         raise ValidationError(
             f"{name} must be a boolean value (true/false), got: '{value}'"
@@ -274,6 +287,10 @@ def validate_vessel_dimensions(
     """
     Validate vessel dimensions for physical consistency.
     """
+    # Common case: everything valid (thickness < radius as mm < OD_m * 500)
+    if OD_m > 0 and thickness_mm >= 0 and L_tangent_m >= 0 and thickness_mm < OD_m * 500.0:
+        return OD_m, thickness_mm, L_tangent_m
+
     if OD_m <= 0:
         raise ValidationError(f"Outer diameter must be positive, got: {OD_m} m")
     